@@ -4,6 +4,7 @@ Classifier Service - Wraps the DatingClassifier for API use with database integr
 
 import sys
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List
 from PIL import Image
@@ -48,6 +49,7 @@ class DatabaseAwareCLIPClassifier(CLIPClassifier):
         self.reference_text_features = []
         self.positive_examples = []
         self.negative_examples = []
+        self._embedding_cache = OrderedDict()
 
         # Create a mock pref_manager that redirects to our methods
         class MockPrefManager:
@@ -66,6 +68,7 @@ class DatabaseAwareCLIPClassifier(CLIPClassifier):
         self.pref_manager = MockPrefManager(self)
 
         self._load_all_training_data_from_db()
+        self._build_feature_matrices()
 
         logger.info(f"✅ CLIP classifier loaded {len(self.reference_features)} reference images from database")
         logger.info(f"Loaded {len(self.positive_examples)} positive examples")
@@ -220,6 +223,7 @@ class DatabaseAwareClassifier(DatingClassifier):
         self.db = db
         # Initialize parent without loading from preferences file
         self.preferences = self._load_preferences_from_db()
+        self._compile_keyword_matchers()
 
         # Initialize image analysis
         self.image_model = self._initialize_image_model()
@@ -231,6 +235,7 @@ class DatabaseAwareClassifier(DatingClassifier):
         self.negative_examples = []
 
         self._load_all_training_data()
+        self._build_feature_matrices()
 
         logger.info(f"Loaded {len(self.reference_features)} reference images from database")
         logger.info(f"Loaded {len(self.positive_examples)} positive examples")
@@ -288,47 +293,20 @@ class DatabaseAwareClassifier(DatingClassifier):
             }
         }
 
-    def _load_all_training_data(self):
-        """Load training data from database instead of files"""
-        # Load reference images from database
-        try:
-            ref_images = self.db.query(ReferenceImage).all()
-            logger.info(f"Found {len(ref_images)} reference images in database")
-
-            for ref_img in ref_images:
-                logger.debug(f"Loading reference image: {ref_img.file_path}")
-                features = self._extract_image_features(ref_img.file_path)
-                if features is not None:
-                    self.reference_features.append({
-                        'features': features,
-                        'category': ref_img.category,
-                        'description': ref_img.description,
-                        'id': ref_img.id
-                    })
-                    logger.debug(f"Successfully loaded features for image {ref_img.id}")
-                else:
-                    logger.warning(f"Failed to extract features from {ref_img.file_path}")
-        except Exception as e:
-            logger.error(f"Failed to load reference images from database: {e}")
-
-        # Load positive/negative examples from file system (legacy)
-        liked_dir = "config/liked_profiles"
-        if os.path.exists(liked_dir):
-            for img_file in os.listdir(liked_dir):
-                if img_file.endswith(('.jpg', '.png', '.jpeg')):
-                    img_path = os.path.join(liked_dir, img_file)
-                    features = self._extract_image_features(img_path)
-                    if features is not None:
-                        self.positive_examples.append(features)
-
-        disliked_dir = "config/disliked_profiles"
-        if os.path.exists(disliked_dir):
-            for img_file in os.listdir(disliked_dir):
-                if img_file.endswith(('.jpg', '.png', '.jpeg')):
-                    img_path = os.path.join(disliked_dir, img_file)
-                    features = self._extract_image_features(img_path)
-                    if features is not None:
-                        self.negative_examples.append(features)
+    def _get_reference_images(self) -> List[Dict]:
+        """Load reference image records from database instead of files"""
+        ref_images = self.db.query(ReferenceImage).all()
+        logger.info(f"Found {len(ref_images)} reference images in database")
+
+        return [
+            {
+                'file_path': ref_img.file_path,
+                'category': ref_img.category,
+                'description': ref_img.description,
+                'id': ref_img.id
+            }
+            for ref_img in ref_images
+        ]
 
 
 class ClassifierService:
@@ -408,6 +386,9 @@ class ClassifierService:
         if not self.classifier:
             raise RuntimeError("Classifier not initialized")
 
+        if hasattr(self.classifier, 'classify_batch_gpu'):
+            return self.classifier.classify_batch_gpu(screenshot_paths)
+
         return self.classifier.batch_classify(screenshot_paths)
 
     def get_stats(self) -> Dict:
@@ -6,6 +6,7 @@ Scraping CLI - Command-line interface for multi-source profile scraping
 import sys
 import os
 import json
+import orjson
 from pathlib import Path
 import argparse
 from typing import List, Optional
@@ -228,8 +229,8 @@ class ScrapingCLI:
         
         try:
             if format.lower() == 'json':
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(profile_dicts, f, indent=2, ensure_ascii=False, default=str)
+                with open(output_file, 'wb') as f:
+                    f.write(orjson.dumps(profile_dicts, default=str, option=orjson.OPT_INDENT_2))
             elif format.lower() == 'csv':
                 import csv
                 if profile_dicts:
@@ -274,8 +275,8 @@ class ScrapingCLI:
                     'errors': result.error_messages
                 }
             
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False, default=str)
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(output_data, default=str, option=orjson.OPT_INDENT_2))
             
             print(f"💾 Results saved to {output_file}")
             
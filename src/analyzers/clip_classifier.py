@@ -3,19 +3,22 @@ CLIP-based Dating Classifier - Multimodal understanding with vision + language
 Uses OpenAI's CLIP model for superior semantic understanding of dating profiles
 """
 
+from collections import OrderedDict
+import imagehash
 import numpy as np
 import pytesseract
 from PIL import Image
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import torch
 from transformers import CLIPProcessor, CLIPModel
-from sklearn.metrics.pairwise import cosine_similarity
 from loguru import logger
 import os
 import sys
 from pathlib import Path
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 from src.analyzers.dating_classifier import ClassificationResult
 from src.utils.preference_manager import PreferenceManager
 
@@ -31,6 +34,9 @@ class CLIPClassifier:
     - Can understand text descriptions natively
     """
 
+    # Maximum number of screenshot embeddings kept in the perceptual-hash cache
+    EMBEDDING_CACHE_SIZE = 256
+
     def __init__(self, preferences_path: str = "config/preferences.json",
                  model_name: str = "openai/clip-vit-base-patch32"):
         """
@@ -69,6 +75,9 @@ class CLIPClassifier:
         self.positive_examples = []
         self.negative_examples = []
 
+        # LRU cache of CLIP image embeddings keyed by screenshot perceptual hash
+        self._embedding_cache: OrderedDict = OrderedDict()
+
         self._load_all_training_data()
 
         logger.info(f"Loaded {len(self.reference_features)} reference images")
@@ -94,6 +103,44 @@ class CLIPClassifier:
             logger.error(f"Failed to extract CLIP features from {image_path}: {e}")
             return None
 
+    def _extract_image_features_batch(self, image_paths: List[str],
+                                      batch_size: int = 16) -> List[Optional[np.ndarray]]:
+        """
+        Extract CLIP image features for many images with batched forward passes
+
+        Returns:
+            List aligned with image_paths; entries are None for unreadable images
+        """
+        features: List[Optional[np.ndarray]] = [None] * len(image_paths)
+
+        for start in range(0, len(image_paths), batch_size):
+            indices = []
+            images = []
+            for i in range(start, min(start + batch_size, len(image_paths))):
+                try:
+                    images.append(Image.open(image_paths[i]).convert('RGB'))
+                    indices.append(i)
+                except Exception as e:
+                    logger.error(f"Failed to load image {image_paths[i]}: {e}")
+
+            if not images:
+                continue
+
+            try:
+                inputs = self.processor(images=images, return_tensors="pt").to(self.device)
+
+                with torch.no_grad():
+                    image_features = self.model.get_image_features(**inputs)
+                    image_features = image_features / image_features.norm(dim=-1, keepdim=True)
+                    batch_features = image_features.cpu().numpy()
+
+                for row, i in enumerate(indices):
+                    features[i] = batch_features[row]
+            except Exception as e:
+                logger.error(f"Failed to extract CLIP features for batch starting at {start}: {e}")
+
+        return features
+
     def _extract_text_features(self, text: str) -> Optional[np.ndarray]:
         """Extract CLIP text features from a description"""
         try:
@@ -158,30 +205,66 @@ class CLIPClassifier:
                     if features is not None:
                         self.negative_examples.append(features)
 
+        self._build_feature_matrices()
+
+    @staticmethod
+    def _stack_features(features: List[np.ndarray]) -> Optional[np.ndarray]:
+        """Stack feature vectors into a contiguous (N, D) float32 matrix"""
+        if not features:
+            return None
+        return np.ascontiguousarray(np.stack(features), dtype=np.float32)
+
+    def _build_feature_matrices(self):
+        """Stack loaded training features so similarities are a single matmul"""
+        self._ref_mat = self._stack_features([ref['features'] for ref in self.reference_features])
+        self._pos_mat = self._stack_features(self.positive_examples)
+        self._neg_mat = self._stack_features(self.negative_examples)
+
+    def _calculate_similarities(self, query_features: np.ndarray) -> Tuple[Optional[np.ndarray], ...]:
+        """
+        Cosine similarities of (B, D) normalized queries against the training data
+
+        Returns:
+            Tuple of (reference, positive, negative) (B, N) similarity matrices,
+            each None when that training set is empty
+        """
+        queries = np.asarray(query_features, dtype=np.float32)
+        return tuple(
+            queries @ matrix.T if matrix is not None else None
+            for matrix in (self._ref_mat, self._pos_mat, self._neg_mat)
+        )
+
     def _calculate_physical_score(self, screenshot_features: np.ndarray) -> tuple[float, List[str]]:
         """
         Calculate physical attractiveness score using CLIP features
 
+        Returns:
+            Tuple of (score, reasons)
+        """
+        ref_sims, pos_sims, neg_sims = self._calculate_similarities(screenshot_features.reshape(1, -1))
+        return self._score_physical_similarities(
+            ref_sims[0] if ref_sims is not None else None,
+            pos_sims[0] if pos_sims is not None else None,
+            neg_sims[0] if neg_sims is not None else None
+        )
+
+    def _score_physical_similarities(self, reference_similarities: Optional[np.ndarray],
+                                     positive_similarities: Optional[np.ndarray],
+                                     negative_similarities: Optional[np.ndarray]) -> tuple[float, List[str]]:
+        """
+        Turn similarity rows for one screenshot into a physical score
+
         Returns:
             Tuple of (score, reasons)
         """
         reasons = []
 
-        if len(self.reference_features) == 0:
+        if reference_similarities is None:
             logger.warning("No reference images loaded - using neutral physical score")
             return 0.5, ["No reference images for comparison"]
 
-        # Calculate similarity to reference images
-        reference_similarities = []
-        for ref in self.reference_features:
-            similarity = cosine_similarity(
-                screenshot_features.reshape(1, -1),
-                ref['features'].reshape(1, -1)
-            )[0][0]
-            reference_similarities.append(similarity)
-
-        avg_ref_similarity = np.mean(reference_similarities)
-        max_ref_similarity = np.max(reference_similarities)
+        avg_ref_similarity = reference_similarities.mean()
+        max_ref_similarity = reference_similarities.max()
 
         # Use max similarity as primary score, with avg as backup
         physical_score = 0.7 * max_ref_similarity + 0.3 * avg_ref_similarity
@@ -197,23 +280,15 @@ class CLIPClassifier:
             reasons.append("Low visual similarity to your reference images")
 
         # Consider positive/negative examples if available
-        if len(self.positive_examples) > 0:
-            positive_similarities = [
-                cosine_similarity(screenshot_features.reshape(1, -1), pos.reshape(1, -1))[0][0]
-                for pos in self.positive_examples
-            ]
-            avg_positive = np.mean(positive_similarities)
+        if positive_similarities is not None:
+            avg_positive = positive_similarities.mean()
 
             if avg_positive > 0.65:
                 physical_score = physical_score * 0.6 + avg_positive * 0.4
                 reasons.append("Similar to profiles you've liked before")
 
-        if len(self.negative_examples) > 0:
-            negative_similarities = [
-                cosine_similarity(screenshot_features.reshape(1, -1), neg.reshape(1, -1))[0][0]
-                for neg in self.negative_examples
-            ]
-            avg_negative = np.mean(negative_similarities)
+        if negative_similarities is not None:
+            avg_negative = negative_similarities.mean()
 
             if avg_negative > 0.65:
                 physical_score = physical_score * 0.7  # Reduce score
@@ -256,10 +331,8 @@ class CLIPClassifier:
         if bio_text:
             bio_features = self._extract_text_features(bio_text)
             if bio_features is not None:
-                text_similarity = cosine_similarity(
-                    desired_features.reshape(1, -1),
-                    bio_features.reshape(1, -1)
-                )[0][0]
+                # Both CLIP embeddings are unit-normalized, so cosine is a dot product
+                text_similarity = float(np.dot(desired_features, bio_features))
 
                 if text_similarity > 0.6:
                     reasons.append(f"Bio aligns well with your personality preferences: {traits_text}")
@@ -305,30 +378,92 @@ class CLIPClassifier:
 
         return float(interest_score), reasons
 
+    def _get_image_hash(self, screenshot_path: str) -> Optional[str]:
+        """Perceptual hash of a screenshot, or None if it cannot be read"""
+        try:
+            with Image.open(screenshot_path) as image:
+                return str(imagehash.phash(image))
+        except Exception as e:
+            logger.debug(f"Could not hash {screenshot_path}: {e}")
+            return None
+
+    def _get_cached_features(self, image_hash: Optional[str]) -> Optional[np.ndarray]:
+        """Return a cached screenshot embedding, refreshing LRU order"""
+        if image_hash is None:
+            return None
+        features = self._embedding_cache.get(image_hash)
+        if features is not None:
+            self._embedding_cache.move_to_end(image_hash)
+        return features
+
+    def _store_cached_features(self, image_hash: Optional[str], features: Optional[np.ndarray]):
+        """Store a screenshot embedding in the LRU cache, evicting the oldest entry if full"""
+        if image_hash is None or features is None:
+            return
+        self._embedding_cache[image_hash] = features
+        self._embedding_cache.move_to_end(image_hash)
+        while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embedding_cache.popitem(last=False)
+
     def classify_screenshot(self, screenshot_path: str,
                           min_threshold: Optional[float] = None) -> ClassificationResult:
         """
         Main classification method using CLIP
 
+        Screenshots that are perceptually identical to a previously classified
+        one (retries, repeated views of the same profile) reuse its CLIP
+        embedding. OCR and scoring always run, since the bio is a small part of
+        the frame and can change without changing the hash.
+
         Args:
             screenshot_path: Path to screenshot image
             min_threshold: Minimum score threshold for match (uses preferences if None)
         """
-        result = ClassificationResult()
-        result.metadata['screenshot_path'] = screenshot_path
+        image_hash = self._get_image_hash(screenshot_path)
+        screenshot_features = self._get_cached_features(image_hash)
+        if screenshot_features is None:
+            # Extract image features using CLIP
+            screenshot_features = self._extract_image_features(screenshot_path)
+            self._store_cached_features(image_hash, screenshot_features)
+        else:
+            logger.opt(lazy=True).debug("Embedding cache hit for {}", lambda: screenshot_path)
 
-        # Extract image features using CLIP
-        screenshot_features = self._extract_image_features(screenshot_path)
         if screenshot_features is None:
             logger.error(f"Failed to extract features from {screenshot_path}")
+            result = ClassificationResult()
+            result.metadata['screenshot_path'] = screenshot_path
             return result
 
         # Extract text from screenshot
         extracted_text = self._extract_text_from_screenshot(screenshot_path)
+
+        physical_score, physical_reasons = self._calculate_physical_score(screenshot_features)
+
+        self._refresh_preferences()
+        return self._build_result(
+            screenshot_path, screenshot_features, extracted_text,
+            physical_score, physical_reasons, min_threshold
+        )
+
+    def _refresh_preferences(self):
+        """Reload preferences from the database to pick up the latest weights"""
+        if hasattr(self.pref_manager, 'parent'):
+            # MockPrefManager - reload from database
+            self.preferences = self.pref_manager.parent._load_preferences_from_db()
+        elif hasattr(self, '_load_preferences_from_db'):
+            # DatabaseAwareCLIPClassifier - reload from database
+            self.preferences = self._load_preferences_from_db()
+
+    def _build_result(self, screenshot_path: str, screenshot_features: np.ndarray,
+                      extracted_text: str, physical_score: float,
+                      physical_reasons: List[str],
+                      min_threshold: Optional[float]) -> ClassificationResult:
+        """Combine component scores into a ClassificationResult"""
+        result = ClassificationResult()
+        result.metadata['screenshot_path'] = screenshot_path
         result.extracted_data['bio'] = extracted_text
 
         # Calculate component scores
-        physical_score, physical_reasons = self._calculate_physical_score(screenshot_features)
         personality_score, personality_reasons = self._calculate_personality_score(
             extracted_text, screenshot_features
         )
@@ -338,14 +473,6 @@ class CLIPClassifier:
         result.component_scores['personality'] = personality_score
         result.component_scores['interests'] = interest_score
 
-        # Get weights from preferences (reload from database to get latest values)
-        if hasattr(self.pref_manager, 'parent'):
-            # MockPrefManager - reload from database
-            self.preferences = self.pref_manager.parent._load_preferences_from_db()
-        elif hasattr(self, '_load_preferences_from_db'):
-            # DatabaseAwareCLIPClassifier - reload from database
-            self.preferences = self._load_preferences_from_db()
-
         result.weights = self.preferences['scoring_weights']
 
         # Calculate weighted confidence score
@@ -377,6 +504,64 @@ class CLIPClassifier:
             results.append(result)
         return results
 
+    def classify_batch_gpu(self, screenshot_paths: List[str],
+                           min_threshold: Optional[float] = None,
+                           batch_size: int = 16) -> List[ClassificationResult]:
+        """
+        Classify multiple screenshots with batched CLIP encoding
+
+        Image features for all uncached screenshots are encoded in batched
+        forward passes, and their similarities to the training data are
+        computed as one (B, N) matrix product per training set.
+
+        Args:
+            screenshot_paths: Paths to screenshot images
+            min_threshold: Minimum score threshold for match (uses preferences if None)
+            batch_size: Number of images per CLIP forward pass
+        """
+        image_hashes = [self._get_image_hash(path) for path in screenshot_paths]
+        features = [self._get_cached_features(image_hash) for image_hash in image_hashes]
+
+        pending = [i for i, screenshot_features in enumerate(features) if screenshot_features is None]
+        extracted = self._extract_image_features_batch(
+            [screenshot_paths[i] for i in pending], batch_size=batch_size
+        )
+        for i, screenshot_features in zip(pending, extracted):
+            features[i] = screenshot_features
+            self._store_cached_features(image_hashes[i], screenshot_features)
+
+        results: List[Optional[ClassificationResult]] = [None] * len(screenshot_paths)
+        encoded = []
+        for i, screenshot_features in enumerate(features):
+            if screenshot_features is None:
+                logger.error(f"Failed to extract features from {screenshot_paths[i]}")
+                result = ClassificationResult()
+                result.metadata['screenshot_path'] = screenshot_paths[i]
+                results[i] = result
+            else:
+                encoded.append((i, screenshot_features))
+
+        if encoded:
+            query_matrix = np.stack([screenshot_features for _, screenshot_features in encoded])
+            ref_sims, pos_sims, neg_sims = self._calculate_similarities(query_matrix)
+
+            self._refresh_preferences()
+            for row, (i, screenshot_features) in enumerate(encoded):
+                path = screenshot_paths[i]
+                physical_score, physical_reasons = self._score_physical_similarities(
+                    ref_sims[row] if ref_sims is not None else None,
+                    pos_sims[row] if pos_sims is not None else None,
+                    neg_sims[row] if neg_sims is not None else None
+                )
+                extracted_text = self._extract_text_from_screenshot(path)
+
+                results[i] = self._build_result(
+                    path, screenshot_features, extracted_text,
+                    physical_score, physical_reasons, min_threshold
+                )
+
+        return results
+
     def get_stats(self) -> Dict:
         """Get classifier statistics"""
         return {
@@ -3,25 +3,35 @@ Dating Classifier - Unified multimodal classification system
 Analyzes profile screenshots to determine match compatibility
 """
 
+import ahocorasick
 import cv2
+import numba
 import numpy as np
-import pytesseract
+import simsimd
+from tesserocr import PyTessBaseAPI
 from PIL import Image
 from typing import Dict, List, Tuple, Optional
 import torch
-import torchvision.transforms as transforms
+from torch.utils.data import DataLoader, Dataset
 from torchvision import models
-from sklearn.metrics.pairwise import cosine_similarity
 import re
 from loguru import logger
+import hashlib
 import json
 import os
+import shutil
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+if _PROJECT_ROOT not in sys.path:
+    sys.path.append(_PROJECT_ROOT)
 from src.utils.preference_manager import PreferenceManager
+from src.utils.image_transforms import fast_transform
 
 
 class ClassificationResult:
@@ -65,33 +75,146 @@ class ClassificationResult:
         }
 
     def __str__(self) -> str:
-        """Human-readable string representation"""
+        """
+        Human-readable string representation
+
+        Only built on demand (e.g. when printed); classification and batch code
+        never format results, so this is kept out of the hot path.
+        """
         match_str = "✅ MATCH" if self.is_match else "❌ NO MATCH"
-        lines = [
-            f"\n{'='*60}",
-            f"{match_str} (Confidence: {self.confidence_score:.1%})",
-            f"{'='*60}",
-            f"\n📊 Component Scores:",
-            f"  • Physical:    {self.component_scores['physical']:.1%} (weight: {self.weights['physical']:.1%})",
-            f"  • Personality: {self.component_scores['personality']:.1%} (weight: {self.weights['personality']:.1%})",
-            f"  • Interests:   {self.component_scores['interests']:.1%} (weight: {self.weights['interests']:.1%})",
-            f"\n📝 Extracted Data:",
+        rule = '=' * 60
+        parts = [
+            f"\n{rule}\n{match_str} (Confidence: {self.confidence_score:.1%})\n{rule}\n\n📊 Component Scores:"
         ]
+        parts.extend(
+            f"  • {label:<12} {self.component_scores[key]:.1%} (weight: {self.weights[key]:.1%})"
+            for key, label in (('physical', 'Physical:'), ('personality', 'Personality:'), ('interests', 'Interests:'))
+        )
+        parts.append("\n📝 Extracted Data:")
+
+        name = self.extracted_data['name']
+        age = self.extracted_data['age']
+        bio = self.extracted_data['bio']
+        if name:
+            parts.append(f"  • Name: {name}")
+        if age:
+            parts.append(f"  • Age: {age}")
+        if bio:
+            parts.append(f"  • Bio: {bio[:100] + '...' if len(bio) > 100 else bio}")
+
+        parts.append("\n💡 Reasons:")
+        parts.extend(f"  • {reason}" for reason in self.reasons)
+        parts.append(f"{rule}\n")
+        return '\n'.join(parts)
+
+
+# File extensions accepted as training images
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png'})
+
+
+@numba.njit(cache=True)
+def _combine_physical_scores(avg_ref_sim: float, max_ref_sim: float,
+                             avg_pos_sim: float, avg_neg_sim: float) -> float:
+    """
+    Combine similarity statistics into a physical score
+
+    NaN marks a training set that is empty. Returns 0.5 when there is no
+    training data at all.
+    """
+    total = 0.0
+    total_weight = 0.0
+
+    # Reference images: average with bonus for strong matches
+    if not np.isnan(avg_ref_sim):
+        total += ((avg_ref_sim * 0.6) + (max_ref_sim * 0.4)) * 0.7
+        total_weight += 0.7
+
+    # Positive/negative examples: relative scoring when both exist
+    if not np.isnan(avg_pos_sim):
+        if not np.isnan(avg_neg_sim):
+            training_score = (avg_pos_sim - avg_neg_sim + 1) / 2
+        else:
+            training_score = avg_pos_sim
+        total += training_score * 0.3
+        total_weight += 0.3
+
+    if total_weight == 0.0:
+        return 0.5
+    return max(0.0, min(1.0, total / total_weight))
+
+
+@numba.njit(cache=True)
+def _score_bio_keywords(keyword_counts: np.ndarray, has_partner_preferences: bool) -> Tuple[float, float]:
+    """
+    Score personality and interests from per-category keyword hit counts
+
+    keyword_counts is ordered as _KEYWORD_CATEGORIES.
+    """
+    negative = keyword_counts[0]
+    positive = keyword_counts[1]
+    traits = keyword_counts[2]
+    shared = keyword_counts[3]
+    dealbreakers = keyword_counts[4]
+
+    if negative > 0:
+        personality = 0.0
+    else:
+        personality = 0.5 + 0.08 * positive
+        if has_partner_preferences:
+            personality += 0.15 * traits
+        personality = min(1.0, personality)
+
+    interests = 0.5
+    if has_partner_preferences:
+        if dealbreakers > 0:
+            interests = 0.0
+        else:
+            interests = min(1.0, 0.5 + 0.15 * shared)
 
-        if self.extracted_data['name']:
-            lines.append(f"  • Name: {self.extracted_data['name']}")
-        if self.extracted_data['age']:
-            lines.append(f"  • Age: {self.extracted_data['age']}")
-        if self.extracted_data['bio']:
-            bio_preview = self.extracted_data['bio'][:100] + "..." if len(self.extracted_data['bio']) > 100 else self.extracted_data['bio']
-            lines.append(f"  • Bio: {bio_preview}")
+    return personality, interests
 
-        lines.append(f"\n💡 Reasons:")
-        for reason in self.reasons:
-            lines.append(f"  • {reason}")
 
-        lines.append(f"{'='*60}\n")
-        return '\n'.join(lines)
+@numba.njit(cache=True)
+def _weighted_confidence(scores: np.ndarray, weights: np.ndarray) -> float:
+    """Weighted sum of (physical, personality, interests) component scores"""
+    total = 0.0
+    for i in range(scores.shape[0]):
+        total += scores[i] * weights[i]
+    return total
+
+
+# Keyword categories in the order used by _score_bio_keywords
+_KEYWORD_CATEGORIES = ('negative', 'positive', 'traits', 'shared_interests', 'dealbreaker_interests')
+
+
+class _TrainingImageDataset(Dataset):
+    """Decodes and transforms training images so a DataLoader can parallelize it"""
+
+    def __init__(self, image_paths: List[str], transform):
+        self.image_paths = image_paths
+        self.transform = transform
+
+    def __len__(self) -> int:
+        return len(self.image_paths)
+
+    def __getitem__(self, index: int) -> Tuple[int, Optional[torch.Tensor]]:
+        try:
+            image = cv2.imread(self.image_paths[index], cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError("could not decode image")
+            return index, self.transform(image)
+        except Exception as e:
+            logger.error(f"Failed to extract features from {self.image_paths[index]}: {e}")
+            return index, None
+
+
+def _collate_training_images(items: List[Tuple[int, Optional[torch.Tensor]]]):
+    """Collate dataset items, dropping images that failed to decode"""
+    items = [(index, tensor) for index, tensor in items if tensor is not None]
+    if not items:
+        return [], None
+    indices, tensors = zip(*items)
+    return list(indices), torch.stack(tensors)
 
 
 class DatingClassifier:
@@ -100,11 +223,18 @@ class DatingClassifier:
     Combines image similarity, text analysis, and user preferences
     """
 
+    # On-disk caches for ResNet features and OCR text, keyed by file content hash
+    FEATURE_CACHE_DIR = Path("cache/features/resnet50_cv2")
+    # Stacked training feature matrices, keyed by a fingerprint of the training set
+    TRAINING_CACHE_DIR = Path("cache/training")
+    OCR_CACHE_DIR = Path("cache/ocr")
+
     def __init__(self, preferences_path: str = "config/preferences.json"):
         logger.info("Initializing DatingClassifier...")
 
         self.pref_manager = PreferenceManager(preferences_path)
         self.preferences = self.pref_manager.get_all_preferences()
+        self._compile_keyword_matchers()
 
         # Initialize image analysis
         self.image_model = self._initialize_image_model()
@@ -116,80 +246,427 @@ class DatingClassifier:
         self.negative_examples = []
 
         self._load_all_training_data()
+        self._build_feature_matrices()
 
         logger.info(f"Loaded {len(self.reference_features)} reference images")
         logger.info(f"Loaded {len(self.positive_examples)} positive examples")
         logger.info(f"Loaded {len(self.negative_examples)} negative examples")
 
+    def _compile_keyword_matchers(self):
+        """
+        Build one Aho-Corasick automaton over every preference keyword category
+
+        A single pass over a bio then finds all keywords regardless of how many
+        there are. Each automaton entry records (category, position, keyword) so
+        hits can be bucketed per category in preference order.
+        """
+        bio_keywords = self.preferences.get('bio_keywords', {})
+        partner_prefs = self.preferences.get('partner_preferences', {})
+        interests_pref = partner_prefs.get('interests', {})
+
+        categories = {
+            'negative': bio_keywords.get('negative', []),
+            'positive': bio_keywords.get('positive', []),
+            'traits': partner_prefs.get('personality', {}).get('traits', []),
+            'shared_interests': interests_pref.get('shared_interests', []),
+            'dealbreaker_interests': interests_pref.get('dealbreaker_interests', [])
+        }
+        self._keywords = {
+            category: tuple(keyword for keyword in keywords if keyword)
+            for category, keywords in categories.items()
+        }
+
+        entries: Dict[str, List[Tuple[str, int, str]]] = {}
+        for category, keywords in self._keywords.items():
+            for position, keyword in enumerate(keywords):
+                entries.setdefault(keyword.lower(), []).append((category, position, keyword))
+
+        self._automaton = None
+        if entries:
+            self._automaton = ahocorasick.Automaton()
+            for word, word_entries in entries.items():
+                self._automaton.add_word(word, tuple(word_entries))
+            self._automaton.make_automaton()
+
+    def _match_keywords(self, bio_lower: str) -> Dict[str, List[str]]:
+        """Find all preference keywords in a lowercased bio, bucketed by category"""
+        found: Dict[str, Dict[int, str]] = {category: {} for category in self._keywords}
+
+        if self._automaton is not None and bio_lower:
+            for _, word_entries in self._automaton.iter(bio_lower):
+                for category, position, keyword in word_entries:
+                    found[category][position] = keyword
+
+        return {
+            category: [hits[position] for position in sorted(hits)]
+            for category, hits in found.items()
+        }
+
     def _initialize_image_model(self):
         """Initialize pre-trained ResNet model for image feature extraction"""
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+
         model = models.resnet50(pretrained=True)
         model = torch.nn.Sequential(*list(model.children())[:-1])
         model.eval()
+        model = model.to(self.device)
+        if self.device == "cuda":
+            # Tensor cores prefer NHWC layout and fp16 operands
+            model = model.to(memory_format=torch.channels_last).half()
+
+        if self.preferences.get('performance', {}).get('compile_image_model', False):
+            model = self._compile_image_model(model)
+
         return model
 
+    def _compile_image_model(self, model: torch.nn.Module) -> torch.nn.Module:
+        """
+        Compile the feature extractor with torch.compile, keeping it only if faster
+
+        Compilation is paid for once here with warmup passes; if the compiled
+        model is not faster than eager mode on a single image, eager is kept.
+        """
+        dummy = self._prepare_image_batch(torch.zeros(1, 3, 224, 224))
+
+        def time_forward(m: torch.nn.Module) -> float:
+            with torch.no_grad():
+                start = time.perf_counter()
+                m(dummy)
+                if self.device == "cuda":
+                    torch.cuda.synchronize()
+                return time.perf_counter() - start
+
+        try:
+            time_forward(model)
+            eager_latency = time_forward(model)
+
+            compiled = torch.compile(model, mode="reduce-overhead")
+            for _ in range(3):
+                time_forward(compiled)
+            compiled_latency = time_forward(compiled)
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager model: {e}")
+            return model
+
+        if compiled_latency >= eager_latency:
+            logger.info(f"Compiled model not faster ({compiled_latency*1000:.1f}ms vs "
+                        f"{eager_latency*1000:.1f}ms), using eager model")
+            return model
+
+        logger.info(f"Using compiled image model ({compiled_latency*1000:.1f}ms vs "
+                    f"{eager_latency*1000:.1f}ms eager)")
+        return compiled
+
     def _get_image_transform(self):
-        """Get image transformation pipeline"""
-        return transforms.Compose([
-            transforms.Resize(256),
-            transforms.CenterCrop(224),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=[0.485, 0.456, 0.406],
-                               std=[0.229, 0.224, 0.225])
-        ])
+        """Get image transformation pipeline (BGR ndarray -> normalized tensor)"""
+        return fast_transform
+
+    def _get_reference_images(self) -> List[Dict]:
+        """Reference image records (file_path, category, description, id)"""
+        return self.pref_manager.get_reference_images()
 
     def _load_all_training_data(self):
         """Load all training data including reference images and examples"""
-        # Load reference images (highest priority)
         try:
-            reference_images = self.pref_manager.get_reference_images()
-            for ref_img in reference_images:
-                features = self._extract_image_features(ref_img['file_path'])
-                if features is not None:
-                    self.reference_features.append({
-                        'features': features,
-                        'category': ref_img['category'],
-                        'description': ref_img['description'],
-                        'id': ref_img['id']
-                    })
+            reference_images = self._get_reference_images()
         except Exception as e:
             logger.warning(f"Failed to load reference images: {e}")
+            reference_images = []
+
+        liked_paths = self._list_training_images("config/liked_profiles")
+        disliked_paths = self._list_training_images("config/disliked_profiles")
+
+        reference_paths = [ref_img['file_path'] for ref_img in reference_images]
+        cache_dir = self._training_cache_dir(reference_images, liked_paths + disliked_paths)
+        if self._load_training_cache(cache_dir):
+            logger.info(f"Loaded training features from {cache_dir}")
+            return
+
+        # Load reference images (highest priority)
+        features_list = self._extract_features_batch(reference_paths)
+        for ref_img, features in zip(reference_images, features_list):
+            if features is not None:
+                self.reference_features.append({
+                    'features': features,
+                    'category': ref_img['category'],
+                    'description': ref_img['description'],
+                    'id': ref_img['id']
+                })
 
         # Load positive examples
-        liked_dir = "config/liked_profiles"
-        if os.path.exists(liked_dir):
-            for img_file in os.listdir(liked_dir):
-                if img_file.endswith(('.jpg', '.png', '.jpeg')):
-                    img_path = os.path.join(liked_dir, img_file)
-                    features = self._extract_image_features(img_path)
-                    if features is not None:
-                        self.positive_examples.append(features)
+        self.positive_examples.extend(
+            f for f in self._extract_features_batch(liked_paths) if f is not None
+        )
 
         # Load negative examples
-        disliked_dir = "config/disliked_profiles"
-        if os.path.exists(disliked_dir):
-            for img_file in os.listdir(disliked_dir):
-                if img_file.endswith(('.jpg', '.png', '.jpeg')):
-                    img_path = os.path.join(disliked_dir, img_file)
-                    features = self._extract_image_features(img_path)
-                    if features is not None:
-                        self.negative_examples.append(features)
+        self.negative_examples.extend(
+            f for f in self._extract_features_batch(disliked_paths) if f is not None
+        )
+
+        self._save_training_cache(cache_dir)
+
+    def _training_cache_dir(self, reference_images: List[Dict], example_paths: List[str]) -> Path:
+        """
+        Cache directory for the stacked training features
+
+        The fingerprint covers every training file's path, size and mtime plus
+        the reference metadata, so any change to the training set misses.
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(str(self.FEATURE_CACHE_DIR).encode())
+
+        reference_keys = [
+            (ref_img['file_path'], str(ref_img['id']), str(ref_img['category']), ref_img['description'] or '')
+            for ref_img in reference_images
+        ]
+        for label, entries in (('reference', reference_keys), ('examples', [(p,) for p in sorted(example_paths)])):
+            digest.update(label.encode())
+            for entry in entries:
+                try:
+                    stat = os.stat(entry[0])
+                    entry = entry + (str(stat.st_size), str(stat.st_mtime_ns))
+                except OSError:
+                    pass
+                digest.update('\0'.join(entry).encode() + b'\n')
+
+        return self.TRAINING_CACHE_DIR / digest.hexdigest()
+
+    def _load_training_cache(self, cache_dir: Path) -> bool:
+        """Memory-map previously stacked training features; returns True on a hit"""
+        meta_file = cache_dir / "reference_meta.json"
+        if not meta_file.exists():
+            return False
 
-    def _extract_image_features(self, image_path: str) -> Optional[np.ndarray]:
-        """Extract feature vector from image using ResNet"""
         try:
-            image = Image.open(image_path).convert('RGB')
-            image_tensor = self.transform(image).unsqueeze(0)
+            with open(meta_file, 'r') as f:
+                reference_meta = json.load(f)
 
-            with torch.no_grad():
-                features = self.image_model(image_tensor)
-                features = features.squeeze().numpy()
+            matrices = {}
+            for name in ('reference', 'positive', 'negative'):
+                matrix_file = cache_dir / f"{name}.npy"
+                matrices[name] = np.load(matrix_file, mmap_mode='r') if matrix_file.exists() else None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable training cache {cache_dir}: {e}")
+            return False
+
+        if matrices['reference'] is not None:
+            self.reference_features = [
+                dict(meta, features=row) for meta, row in zip(reference_meta, matrices['reference'])
+            ]
+        if matrices['positive'] is not None:
+            self.positive_examples = list(matrices['positive'])
+        if matrices['negative'] is not None:
+            self.negative_examples = list(matrices['negative'])
+        return True
+
+    def _save_training_cache(self, cache_dir: Path):
+        """Persist raw stacked training features for memory-mapped warm starts"""
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            stacks = {
+                'reference': [ref['features'] for ref in self.reference_features],
+                'positive': self.positive_examples,
+                'negative': self.negative_examples
+            }
+            for name, features in stacks.items():
+                if features:
+                    np.save(cache_dir / f"{name}.npy", np.stack([f.reshape(-1) for f in features]))
+
+            # Written last so a partially written cache is never treated as a hit
+            reference_meta = [
+                {key: ref[key] for key in ('category', 'description', 'id')}
+                for ref in self.reference_features
+            ]
+            with open(cache_dir / "reference_meta.json", 'w') as f:
+                json.dump(reference_meta, f)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Failed to write training cache {cache_dir}: {e}")
+            return
+
+        # Snapshots of earlier training sets can never hit again
+        for stale_dir in self.TRAINING_CACHE_DIR.iterdir():
+            if stale_dir.is_dir() and stale_dir != cache_dir:
+                shutil.rmtree(stale_dir, ignore_errors=True)
+
+    @staticmethod
+    def _list_training_images(directory: str) -> List[str]:
+        """List image files in a training example directory"""
+        if not os.path.isdir(directory):
+            return []
+        with os.scandir(directory) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS
+                and entry.is_file(follow_symlinks=False)
+            ]
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize each row, leaving all-zero rows untouched"""
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    @classmethod
+    def _quantize(cls, matrix: np.ndarray) -> np.ndarray:
+        """
+        Quantize feature rows to int8 with a symmetric scale
+
+        Rows are L2-normalized first, so every component lies in [-1, 1] and a
+        fixed scale of 127 is used for all vectors. Cosine similarity is scale
+        invariant, so the scale never has to be stored or undone.
+        """
+        normalized = cls._normalize_rows(np.asarray(matrix, dtype=np.float32))
+        return np.ascontiguousarray(np.round(normalized * 127.0), dtype=np.int8)
+
+    def _stack_features(self, features: List[np.ndarray]) -> Optional[np.ndarray]:
+        """Stack feature vectors into a contiguous, int8-quantized (N, D) matrix"""
+        if not features:
+            return None
+        return self._quantize(np.stack([f.reshape(-1) for f in features]))
+
+    @classmethod
+    def _cosine_similarities(cls, matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of every int8 row of matrix to query using SimSIMD kernels
+
+        Rows and query are both unit vectors scaled by 127, so cosine reduces to a
+        plain int8 dot product divided by 127^2 with no per-call norm computation.
+        """
+        query = cls._quantize(query.reshape(1, -1))
+        dots = np.asarray(simsimd.cdist(matrix, query, metric='dot', dtype='i8'), dtype=np.float32)
+        return dots.ravel() * (1.0 / (127.0 * 127.0))
+
+    def _build_feature_matrices(self):
+        """Stack loaded training features so similarities are a single matrix-vector product"""
+        self.reference_matrix = self._stack_features([ref['features'] for ref in self.reference_features])
+        self.positive_matrix = self._stack_features(self.positive_examples)
+        self.negative_matrix = self._stack_features(self.negative_examples)
+
+    def _prepare_image_batch(self, batch: torch.Tensor) -> torch.Tensor:
+        """Move an image batch to the model's device, layout and precision"""
+        if self.device == "cuda":
+            return batch.to(self.device, memory_format=torch.channels_last, non_blocking=True).half()
+        return batch
+
+    def _forward_image_batch(self, batch: torch.Tensor) -> np.ndarray:
+        """Run the feature extractor on an (N, 3, 224, 224) batch, returning (N, D) float32"""
+        batch = self._prepare_image_batch(batch)
+        with torch.inference_mode():
+            if self.device == "cuda":
+                with torch.autocast('cuda', dtype=torch.float16):
+                    features = self.image_model(batch)
+            else:
+                features = self.image_model(batch)
+        return features.flatten(1).float().cpu().numpy()
+
+    @staticmethod
+    def _content_key(data: bytes) -> str:
+        """Cache key for raw file contents"""
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _file_content_key(self, file_path: str) -> Optional[str]:
+        """Cache key for a file on disk, or None if it can't be read"""
+        try:
+            return self._content_key(Path(file_path).read_bytes())
+        except OSError:
+            return None
+
+    @staticmethod
+    def _cache_file(cache_dir: Path, content_key: Optional[str], suffix: str) -> Optional[Path]:
+        """Cache location for a content key"""
+        if content_key is None:
+            return None
+        return cache_dir / f"{content_key}{suffix}"
+
+    @staticmethod
+    def _load_cached_features(cache_file: Optional[Path]) -> Optional[np.ndarray]:
+        """Load cached features, returning None on a miss or unreadable entry"""
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            return np.load(cache_file)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable feature cache {cache_file}: {e}")
+            return None
 
+    @staticmethod
+    def _save_cached_features(cache_file: Optional[Path], features: np.ndarray):
+        """Write features to the on-disk cache, ignoring failures"""
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_file, features)
+        except OSError as e:
+            logger.debug(f"Failed to write feature cache {cache_file}: {e}")
+
+    def _extract_image_features(self, image_path: str) -> Optional[np.ndarray]:
+        """Extract feature vector from image using ResNet"""
+        cache_file = self._cache_file(self.FEATURE_CACHE_DIR, self._file_content_key(image_path), '.npy')
+        features = self._load_cached_features(cache_file)
+        if features is not None:
             return features
+
+        try:
+            image = cv2.imread(image_path, cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError("could not decode image")
+            image_tensor = self.transform(image).unsqueeze(0)
+            features = self._forward_image_batch(image_tensor)[0]
         except Exception as e:
             logger.error(f"Failed to extract features from {image_path}: {e}")
             return None
 
+        self._save_cached_features(cache_file, features)
+        return features
+
+    def _extract_features_batch(self, image_paths: List[str],
+                                batch_size: int = 32) -> List[Optional[np.ndarray]]:
+        """
+        Extract ResNet features for many images in batched forward passes
+
+        Returns:
+            List aligned with image_paths; entries are None for unreadable images
+        """
+        features: List[Optional[np.ndarray]] = [None] * len(image_paths)
+        cache_files = [
+            self._cache_file(self.FEATURE_CACHE_DIR, self._file_content_key(path), '.npy')
+            for path in image_paths
+        ]
+
+        pending = []
+        for i, cache_file in enumerate(cache_files):
+            features[i] = self._load_cached_features(cache_file)
+            if features[i] is None:
+                pending.append(i)
+
+        if not pending:
+            return features
+
+        # Worker start-up only pays off once there is more than one batch to decode
+        num_workers = min(os.cpu_count() or 1, 8) if len(pending) > batch_size else 0
+        loader = DataLoader(
+            _TrainingImageDataset([image_paths[i] for i in pending], self.transform),
+            batch_size=batch_size,
+            num_workers=num_workers,
+            pin_memory=torch.cuda.is_available(),
+            collate_fn=_collate_training_images
+        )
+
+        for indices, batch in loader:
+            if batch is None:
+                continue
+
+            batch_features = self._forward_image_batch(batch)
+            for row, index in enumerate(indices):
+                i = pending[index]
+                features[i] = batch_features[row]
+                self._save_cached_features(cache_files[i], features[i])
+
+        return features
+
     def classify_screenshot(self, screenshot_path: str,
                           min_threshold: Optional[float] = None) -> ClassificationResult:
         """
@@ -203,11 +680,23 @@ class DatingClassifier:
             ClassificationResult object with detailed analysis
         """
         logger.info(f"Classifying screenshot: {screenshot_path}")
+
+        # Read and decode the screenshot once for both OCR and image features
+        content_key, img = self._load_screenshot(screenshot_path)
+
+        # OCR on the worker pool while the ResNet runs here; both release the GIL
+        data_future = self._get_worker_pool().submit(self._extract_profile_data, img, content_key)
+        features = self._extract_screenshot_features(img, content_key)
+        extracted_data = data_future.result()
+
+        return self._build_result(screenshot_path, extracted_data, features, min_threshold)
+
+    def _build_result(self, screenshot_path: str, extracted_data: Dict,
+                      features: Optional[np.ndarray],
+                      min_threshold: Optional[float] = None) -> ClassificationResult:
+        """Score extracted screenshot data and features into a ClassificationResult"""
         result = ClassificationResult()
         result.metadata['screenshot_path'] = screenshot_path
-
-        # Extract data from screenshot
-        extracted_data = self._extract_profile_data(screenshot_path)
         result.extracted_data = extracted_data
 
         # Get weights from preferences
@@ -217,22 +706,22 @@ class DatingClassifier:
             result.weights['interests'] = self.preferences['partner_preferences']['interests']['importance_weight']
 
         # Analyze physical match (image-based)
-        physical_score = self._analyze_physical_match(screenshot_path)
+        physical_score = self._analyze_physical_match(features)
         result.component_scores['physical'] = physical_score
 
-        # Analyze personality match (bio-based)
-        personality_score = self._analyze_personality_match(extracted_data.get('bio', ''))
-        result.component_scores['personality'] = personality_score
+        # Scan the bio for all preference keywords in one pass
+        bio_text = extracted_data.get('bio') or ''
+        keyword_hits = self._match_keywords(bio_text.lower()) if bio_text else None
 
-        # Analyze interest match
-        interest_score = self._analyze_interest_match(extracted_data.get('bio', ''))
+        # Analyze personality and interest match (bio-based)
+        personality_score, interest_score = self._analyze_bio_match(keyword_hits)
+        result.component_scores['personality'] = personality_score
         result.component_scores['interests'] = interest_score
 
         # Calculate weighted final score
-        result.confidence_score = (
-            physical_score * result.weights['physical'] +
-            personality_score * result.weights['personality'] +
-            interest_score * result.weights['interests']
+        result.confidence_score = _weighted_confidence(
+            np.array([physical_score, personality_score, interest_score]),
+            np.array([result.weights['physical'], result.weights['personality'], result.weights['interests']])
         )
 
         # Determine if match
@@ -240,13 +729,36 @@ class DatingClassifier:
         result.is_match = result.confidence_score >= threshold
 
         # Generate reasons
-        result.reasons = self._generate_reasons(result, extracted_data)
+        result.reasons = self._generate_reasons(result, extracted_data, keyword_hits)
 
         logger.info(f"Classification complete: {'MATCH' if result.is_match else 'NO MATCH'} ({result.confidence_score:.2%})")
         return result
 
-    def _extract_profile_data(self, screenshot_path: str) -> Dict:
-        """Extract structured data from screenshot"""
+    def _load_screenshot(self, screenshot_path: str) -> Tuple[Optional[str], Optional[np.ndarray]]:
+        """
+        Read a screenshot from disk once
+
+        Returns:
+            Tuple of (content cache key, decoded BGR image); either may be None
+        """
+        try:
+            data = Path(screenshot_path).read_bytes()
+        except OSError as e:
+            logger.error(f"Failed to read screenshot: {screenshot_path}: {e}")
+            return None, None
+        if not data:
+            # imdecode asserts on an empty buffer instead of returning None
+            logger.error(f"Screenshot {screenshot_path} is empty")
+            return None, None
+
+        img = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if img is None:
+            logger.error(f"Failed to decode screenshot: {screenshot_path}")
+
+        return self._content_key(data), img
+
+    def _extract_profile_data(self, img: Optional[np.ndarray], content_key: Optional[str]) -> Dict:
+        """Extract structured data from a decoded screenshot"""
         data = {
             'name': None,
             'age': None,
@@ -255,16 +767,9 @@ class DatingClassifier:
         }
 
         try:
-            # Read image
-            img = cv2.imread(screenshot_path)
-            if img is None:
-                logger.error(f"Failed to read screenshot: {screenshot_path}")
+            full_text = self._extract_screenshot_text(img, content_key)
+            if full_text is None:
                 return data
-
-            height, width = img.shape[:2]
-
-            # Extract text using OCR from different regions
-            full_text = self._extract_text_from_image(img)
             data['bio'] = full_text
 
             # Try to extract name and age using patterns
@@ -281,17 +786,81 @@ class DatingClassifier:
 
         return data
 
+    def _extract_screenshot_text(self, img: Optional[np.ndarray], content_key: Optional[str]) -> Optional[str]:
+        """OCR a screenshot, reusing cached text for identical files"""
+        cache_file = self._cache_file(self.OCR_CACHE_DIR, content_key, '.txt')
+        if cache_file is not None and cache_file.exists():
+            return cache_file.read_text(encoding='utf-8')
+
+        if img is None:
+            return None
+
+        # Extract text using OCR
+        text = self._extract_text_from_image(img)
+
+        # Empty text may be an OCR failure, so only cache real results
+        if text and cache_file is not None:
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                cache_file.write_text(text, encoding='utf-8')
+            except OSError as e:
+                logger.debug(f"Failed to write OCR cache {cache_file}: {e}")
+
+        return text
+
+    def _get_tess_api(self) -> PyTessBaseAPI:
+        """
+        Get this thread's long-lived Tesseract API, creating it on first use
+
+        A Tesseract handle is not thread-safe, so each OCR thread gets its own.
+        """
+        local = self.__dict__.setdefault('_tess_local', threading.local())
+        tess_api = getattr(local, 'api', None)
+        if tess_api is None:
+            tess_api = PyTessBaseAPI(lang='eng')
+            local.api = tess_api
+            self.__dict__.setdefault('_tess_apis', []).append(tess_api)
+        return tess_api
+
+    def _get_worker_pool(self) -> ThreadPoolExecutor:
+        """
+        Get the persistent thread pool used for decoding and OCR
+
+        The pool outlives individual calls so its threads keep their Tesseract
+        handles warm instead of re-initializing one per call.
+        """
+        pool = self.__dict__.get('_worker_pool')
+        if pool is None:
+            pool = ThreadPoolExecutor(max_workers=min(os.cpu_count() or 1, 8),
+                                      thread_name_prefix='dating-classifier')
+            self._worker_pool = pool
+        return pool
+
+    def close(self):
+        """Shut down the worker pool and release all Tesseract API handles"""
+        pool = self.__dict__.pop('_worker_pool', None)
+        if pool is not None:
+            pool.shutdown(wait=True)
+        for tess_api in self.__dict__.pop('_tess_apis', []):
+            tess_api.End()
+        self.__dict__.pop('_tess_local', None)
+
+    def __del__(self):
+        self.close()
+
     def _extract_text_from_image(self, img: np.ndarray) -> str:
         """Extract text from image using OCR"""
         try:
-            # Preprocess image for better OCR
-            gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+            # Preprocess image for better OCR; UMat lets OpenCV offload to OpenCL when available
+            gray = cv2.cvtColor(cv2.UMat(img), cv2.COLOR_BGR2GRAY)
 
             # Apply threshold to get better text extraction
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
 
-            # Extract text
-            text = pytesseract.image_to_string(thresh)
+            # Extract text with the persistent Tesseract handle
+            tess_api = self._get_tess_api()
+            tess_api.SetImage(Image.fromarray(thresh.get()))
+            text = tess_api.GetUTF8Text()
 
             # Clean up text
             text = ' '.join(text.split())
@@ -301,147 +870,110 @@ class DatingClassifier:
             logger.error(f"OCR failed: {e}")
             return ""
 
-    def _analyze_physical_match(self, screenshot_path: str) -> float:
-        """Analyze physical compatibility using image similarity"""
+    def _extract_screenshot_features(self, img: Optional[np.ndarray],
+                                     content_key: Optional[str]) -> Optional[np.ndarray]:
+        """Extract ResNet features from an already decoded BGR screenshot"""
+        return self._extract_screenshot_features_batch([(content_key, img)])[0]
+
+    def _extract_screenshot_features_batch(
+            self, screenshots: List[Tuple[Optional[str], Optional[np.ndarray]]]) -> List[Optional[np.ndarray]]:
+        """
+        Extract ResNet features from decoded screenshots in one forward pass
+
+        Args:
+            screenshots: (content key, decoded BGR image) pairs from _load_screenshot
+
+        Returns:
+            List aligned with screenshots; entries are None when extraction failed
+        """
+        cache_files = [self._cache_file(self.FEATURE_CACHE_DIR, key, '.npy') for key, _ in screenshots]
+        features = [self._load_cached_features(cache_file) for cache_file in cache_files]
+
+        pending = [i for i, (_, img) in enumerate(screenshots) if features[i] is None and img is not None]
+        if not pending:
+            return features
+
         try:
-            # Extract features from screenshot
-            features = self._extract_image_features(screenshot_path)
+            batch = torch.stack([self.transform(screenshots[i][1]) for i in pending])
+            batch_features = self._forward_image_batch(batch)
+        except Exception as e:
+            logger.error(f"Failed to extract screenshot features: {e}")
+            return features
+
+        for row, i in enumerate(pending):
+            features[i] = batch_features[row]
+            self._save_cached_features(cache_files[i], features[i])
+
+        return features
 
+    def _analyze_physical_match(self, features: Optional[np.ndarray]) -> float:
+        """Analyze physical compatibility using image similarity"""
+        try:
             if features is None:
                 logger.warning("Could not extract features from screenshot")
                 return 0.5
 
-            scores = []
-            weights = []
+            query = features.reshape(-1)
+            avg_ref_sim = max_ref_sim = avg_pos_sim = avg_neg_sim = np.nan
 
             # Method 1: Compare to reference images (highest priority)
-            if self.reference_features:
-                ref_similarities = []
-                for ref_data in self.reference_features:
-                    sim = cosine_similarity(
-                        features.reshape(1, -1),
-                        ref_data['features'].reshape(1, -1)
-                    )[0][0]
-                    ref_similarities.append(sim)
-
-                avg_ref_sim = np.mean(ref_similarities)
-                max_ref_sim = np.max(ref_similarities)
-
-                # Use average with bonus for strong matches
-                ref_score = (avg_ref_sim * 0.6) + (max_ref_sim * 0.4)
-                scores.append(ref_score)
-                weights.append(0.7)
-
-                logger.debug(f"Reference similarity: avg={avg_ref_sim:.3f}, max={max_ref_sim:.3f}, score={ref_score:.3f}")
+            if self.reference_matrix is not None:
+                ref_similarities = self._cosine_similarities(self.reference_matrix, query)
+                avg_ref_sim = float(ref_similarities.mean())
+                max_ref_sim = float(ref_similarities.max())
+                logger.opt(lazy=True).debug("Reference similarity: avg={:.3f}, max={:.3f}",
+                                            lambda: avg_ref_sim, lambda: max_ref_sim)
 
             # Method 2: Compare to positive/negative examples
-            if self.positive_examples:
-                pos_similarities = [
-                    cosine_similarity(features.reshape(1, -1), pos.reshape(1, -1))[0][0]
-                    for pos in self.positive_examples
-                ]
-                avg_pos_sim = np.mean(pos_similarities)
-
-                if self.negative_examples:
-                    neg_similarities = [
-                        cosine_similarity(features.reshape(1, -1), neg.reshape(1, -1))[0][0]
-                        for neg in self.negative_examples
-                    ]
-                    avg_neg_sim = np.mean(neg_similarities)
-
-                    # Relative scoring
-                    training_score = (avg_pos_sim - avg_neg_sim + 1) / 2
-                else:
-                    training_score = avg_pos_sim
+            if self.positive_matrix is not None:
+                avg_pos_sim = float(self._cosine_similarities(self.positive_matrix, query).mean())
 
-                scores.append(training_score)
-                weights.append(0.3)
+                if self.negative_matrix is not None:
+                    avg_neg_sim = float(self._cosine_similarities(self.negative_matrix, query).mean())
 
-                logger.debug(f"Training similarity: {training_score:.3f}")
+                logger.opt(lazy=True).debug("Training similarity: pos={:.3f}, neg={:.3f}",
+                                            lambda: avg_pos_sim, lambda: avg_neg_sim)
 
-            # Calculate weighted average
-            if scores:
-                total_weight = sum(weights)
-                final_score = sum(s * w for s, w in zip(scores, weights)) / total_weight
-                return max(0.0, min(1.0, final_score))
-            else:
+            if self.reference_matrix is None and self.positive_matrix is None:
                 logger.warning("No training data available for physical analysis")
-                return 0.5
+
+            return _combine_physical_scores(avg_ref_sim, max_ref_sim, avg_pos_sim, avg_neg_sim)
 
         except Exception as e:
             logger.error(f"Physical analysis failed: {e}")
             return 0.5
 
-    def _analyze_personality_match(self, bio_text: str) -> float:
-        """Analyze personality compatibility from bio text"""
-        if not bio_text:
-            return 0.5
+    def _analyze_bio_match(self, keyword_hits: Optional[Dict[str, List[str]]]) -> Tuple[float, float]:
+        """
+        Analyze personality and interest compatibility from the bio's keyword hits
 
-        bio_lower = bio_text.lower()
-        score = 0.5
+        Returns:
+            Tuple of (personality score, interest score)
+        """
+        if not keyword_hits:
+            return 0.5, 0.5
 
-        # Check for negative keywords (dealbreakers)
-        negative_keywords = self.preferences.get('bio_keywords', {}).get('negative', [])
-        for keyword in negative_keywords:
-            if keyword.lower() in bio_lower:
-                logger.debug(f"Found dealbreaker keyword: {keyword}")
-                return 0.0
+        for category in _KEYWORD_CATEGORIES:
+            if keyword_hits[category]:
+                logger.opt(lazy=True).debug("Found {} keywords: {}", lambda: category,
+                                            lambda: ', '.join(keyword_hits[category]))
 
-        # Check for positive personality traits
-        if 'partner_preferences' in self.preferences:
-            traits = self.preferences['partner_preferences']['personality'].get('traits', [])
-            matches = 0
-            for trait in traits:
-                if trait.lower() in bio_lower:
-                    matches += 1
-                    score += 0.15
-                    logger.debug(f"Found desired trait: {trait}")
-
-            if traits:
-                logger.debug(f"Matched {matches}/{len(traits)} personality traits")
-
-        # Check for positive keywords
-        positive_keywords = self.preferences.get('bio_keywords', {}).get('positive', [])
-        for keyword in positive_keywords:
-            if keyword.lower() in bio_lower:
-                score += 0.08
-                logger.debug(f"Found positive keyword: {keyword}")
-
-        return min(1.0, score)
-
-    def _analyze_interest_match(self, bio_text: str) -> float:
-        """Analyze interest compatibility"""
-        if not bio_text:
-            return 0.5
+        keyword_counts = np.array([len(keyword_hits[category]) for category in _KEYWORD_CATEGORIES])
+        personality_score, interest_score = _score_bio_keywords(
+            keyword_counts, 'partner_preferences' in self.preferences
+        )
+        return float(personality_score), float(interest_score)
 
-        bio_lower = bio_text.lower()
-        score = 0.5
+    def _analyze_personality_match(self, keyword_hits: Optional[Dict[str, List[str]]]) -> float:
+        """Analyze personality compatibility from the bio's keyword hits"""
+        return self._analyze_bio_match(keyword_hits)[0]
 
-        if 'partner_preferences' in self.preferences:
-            interests_pref = self.preferences['partner_preferences']['interests']
-
-            # Check for dealbreaker interests
-            dealbreakers = interests_pref.get('dealbreaker_interests', [])
-            for dealbreaker in dealbreakers:
-                if dealbreaker.lower() in bio_lower:
-                    logger.debug(f"Found dealbreaker interest: {dealbreaker}")
-                    return 0.0
-
-            # Check for shared interests
-            shared_interests = interests_pref.get('shared_interests', [])
-            matches = 0
-            for interest in shared_interests:
-                if interest.lower() in bio_lower:
-                    matches += 1
-                    score += 0.15
-                    logger.debug(f"Found shared interest: {interest}")
-
-            if shared_interests:
-                logger.debug(f"Matched {matches}/{len(shared_interests)} shared interests")
-
-        return min(1.0, score)
-
-    def _generate_reasons(self, result: ClassificationResult, extracted_data: Dict) -> List[str]:
+    def _analyze_interest_match(self, keyword_hits: Optional[Dict[str, List[str]]]) -> float:
+        """Analyze interest compatibility from the bio's keyword hits"""
+        return self._analyze_bio_match(keyword_hits)[1]
+
+    def _generate_reasons(self, result: ClassificationResult, extracted_data: Dict,
+                          keyword_hits: Optional[Dict[str, List[str]]] = None) -> List[str]:
         """Generate human-readable reasons for the classification"""
         reasons = []
 
@@ -472,12 +1004,8 @@ class DatingClassifier:
             reasons.append("Limited shared interests found")
 
         # Specific interest mentions
-        bio_text = extracted_data.get('bio', '')
-        if bio_text and 'partner_preferences' in self.preferences:
-            shared_interests = self.preferences['partner_preferences']['interests'].get('shared_interests', [])
-            bio_lower = bio_text.lower()
-
-            found_interests = [i for i in shared_interests if i.lower() in bio_lower]
+        if keyword_hits and 'partner_preferences' in self.preferences:
+            found_interests = keyword_hits['shared_interests']
             if found_interests:
                 if len(found_interests) <= 3:
                     for interest in found_interests:
@@ -505,15 +1033,43 @@ class DatingClassifier:
 
         return reasons if reasons else ["Neutral compatibility - no strong signals either way"]
 
-    def batch_classify(self, screenshot_paths: List[str]) -> List[ClassificationResult]:
-        """Classify multiple screenshots"""
+    def batch_classify(self, screenshot_paths: List[str],
+                       chunk_size: int = 32) -> List[ClassificationResult]:
+        """
+        Classify multiple screenshots
+
+        Screenshots are processed in chunks: decoding and OCR run on the worker
+        pool (OpenCV and Tesseract release the GIL) while image features for the
+        whole chunk go through a single batched ResNet forward pass.
+        """
         results = []
-        for path in screenshot_paths:
+        executor = self._get_worker_pool()
+
+        for start in range(0, len(screenshot_paths), chunk_size):
+            paths = screenshot_paths[start:start + chunk_size]
+
+            # A screenshot that fails to load is skipped without losing the rest of the chunk
+            load_futures = [executor.submit(self._load_screenshot, path) for path in paths]
+            loaded = []
+            for path, future in zip(paths, load_futures):
+                try:
+                    loaded.append((path, future.result()))
+                except Exception as e:
+                    logger.error(f"Failed to classify {path}: {e}")
+
+            screenshots = [screenshot for _, screenshot in loaded]
+            data_futures = [executor.submit(self._extract_profile_data, *item) for item in screenshots]
             try:
-                result = self.classify_screenshot(path)
-                results.append(result)
+                features = self._extract_screenshot_features_batch(screenshots)
             except Exception as e:
-                logger.error(f"Failed to classify {path}: {e}")
+                logger.error(f"Failed to extract screenshot features: {e}")
+                features = [None] * len(screenshots)
+
+            for (path, _), data_future, screenshot_features in zip(loaded, data_futures, features):
+                try:
+                    results.append(self._build_result(path, data_future.result(), screenshot_features))
+                except Exception as e:
+                    logger.error(f"Failed to classify {path}: {e}")
 
         return results
 
@@ -3,40 +3,153 @@ Profile Analyzer - Analyzes profiles based on user preferences
 Uses computer vision and NLP to make swipe decisions
 """
 
+import ahocorasick
 import cv2
 import numpy as np
-import pytesseract
+import simsimd
+from tesserocr import OEM, PSM, PyTessBaseAPI
 from PIL import Image
 from typing import Dict, List, Tuple, Optional
 import torch
-import torchvision.transforms as transforms
+from torch.utils.data import DataLoader, Dataset
 from torchvision import models
-from sklearn.metrics.pairwise import cosine_similarity
 import re
+from functools import lru_cache
 from loguru import logger
+import hashlib
 import json
 import os
 import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Import our preference manager
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 from src.utils.preference_manager import PreferenceManager
+from src.utils.image_transforms import fast_transform
+
+
+# File extensions accepted as training images
+_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.webp'})
+
+# Feature extractor backbones selectable with the performance.image_backbone preference:
+# name -> (constructor, ImageNet weights)
+_IMAGE_BACKBONES = {
+    'resnet50': (models.resnet50, models.ResNet50_Weights.IMAGENET1K_V1),
+    'mobilenet_v3_large': (models.mobilenet_v3_large, models.MobileNet_V3_Large_Weights.IMAGENET1K_V2)
+}
+
+
+@lru_cache(maxsize=64)
+def _compile_keyword_automaton(keywords: Tuple[str, ...]):
+    """Aho-Corasick automaton over a keyword list, built once per distinct list
+    
+    Each lowercased word maps to the list positions it appears at
+    """
+    entries: Dict[str, List[int]] = {}
+    for position, keyword in enumerate(keywords):
+        if keyword:
+            entries.setdefault(keyword.lower(), []).append(position)
+    if not entries:
+        return None
+        
+    automaton = ahocorasick.Automaton()
+    for word, positions in entries.items():
+        automaton.add_word(word, tuple(positions))
+    automaton.make_automaton()
+    return automaton
+
+
+def _find_keywords(keywords: List[str], bio_lower: str) -> List[str]:
+    """Keywords from the list that occur in a lowercased bio, in list order, found in one pass"""
+    keywords = tuple(keywords)
+    automaton = _compile_keyword_automaton(keywords)
+    if automaton is None:
+        return []
+        
+    positions = set()
+    for _, word_positions in automaton.iter(bio_lower):
+        positions.update(word_positions)
+    return [keywords[position] for position in sorted(positions)]
+
+
+@lru_cache(maxsize=64)
+def _compile_red_flag_pattern(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Whole-word pattern over disqualifying keywords, built once per distinct list
+    
+    Matches must not touch a letter or digit on either side, so "poly" never fires
+    inside "polytechnic". All-caps keywords are acronyms ("OF", "ENM") and only
+    match in that case, so "lots of hiking" is not read as "OF"
+    """
+    alternatives = [re.escape(keyword) if keyword.isupper() else f"(?i:{re.escape(keyword)})"
+                    for keyword in keywords if keyword]
+    if not alternatives:
+        return None
+    return re.compile(rf"(?<![^\W_])(?:{'|'.join(alternatives)})(?![^\W_])")
+
+
+class _ImageDirDataset(Dataset):
+    """Decodes and transforms images so a DataLoader can parallelize it"""
+    
+    def __init__(self, image_paths: List[str], transform):
+        self.image_paths = image_paths
+        self.transform = transform
+        
+    def __len__(self) -> int:
+        return len(self.image_paths)
+        
+    def __getitem__(self, index: int) -> Tuple[int, Optional[torch.Tensor]]:
+        try:
+            image = cv2.imread(self.image_paths[index], cv2.IMREAD_COLOR)
+            if image is None:
+                raise ValueError("could not decode image")
+            return index, self.transform(image)
+        except Exception as e:
+            logger.error(f"Failed to extract features from {self.image_paths[index]}: {e}")
+            return index, None
+            
+            
+def _collate_images(items: List[Tuple[int, Optional[torch.Tensor]]]):
+    """Collate dataset items, dropping images that failed to decode"""
+    items = [(index, tensor) for index, tensor in items if tensor is not None]
+    if not items:
+        return [], None
+    indices, tensors = zip(*items)
+    return list(indices), torch.stack(tensors)
 
 
 class ProfileAnalyzer:
     """Analyzes profiles to make swipe decisions"""
     
+    # Local copies of the ImageNet backbone weights, loaded memory-mapped
+    IMAGE_MODEL_WEIGHTS_DIR = Path("cache/models")
+    # On-disk feature caches, one directory per backbone and one .npy per image keyed by content hash
+    FEATURE_CACHE_ROOT = Path("cache/features")
+    # Number of bio OCR results kept in memory, keyed by bio region contents
+    OCR_CACHE_SIZE = 1024
+    # Training matrix rows are preallocated in blocks of at least this many
+    TRAINING_MATRIX_MIN_CAPACITY = 64
+    # Bio regions whose shorter side exceeds this are halved before OCR
+    OCR_DOWNSCALE_MIN_SIDE = 800
+    
     def __init__(self, preferences_path: str = "config/preferences.json"):
         self.preferences = self._load_preferences(preferences_path)
+        self._compile_bio_matcher()
+        self._ocr_cache = OrderedDict()
+        self._ocr_cache_lock = threading.Lock()
         self.pref_manager = PreferenceManager(preferences_path)
         self.image_model = self._initialize_image_model()
         self.transform = self._get_image_transform()
+        # Single-image inputs are copied into this buffer instead of allocating a new batch each call
+        self._input_buf = self._prepare_image_batch(torch.empty(1, 3, 224, 224))
         self.positive_examples = []
         self.negative_examples = []
         self.reference_features = []
         self._load_training_examples()
         self._load_reference_features()
+        self._build_example_matrices()
         
     def _load_preferences(self, path: str) -> Dict:
         """Load user preferences from JSON file"""
@@ -60,56 +173,178 @@ class ProfileAnalyzer:
                 "super_like_threshold": 0.85
             }
             
+    def _compile_bio_matcher(self):
+        """Specialize legacy bio scoring to the current keyword preferences
+        
+        Every keyword is folded into one Aho-Corasick automaton whose payload is
+        the word's precomputed effect on the score, so scoring a bio is a single
+        pass with an early exit on the first red flag and no per-call branching
+        over the preference lists
+        """
+        bio_keywords = self.preferences.get('bio_keywords', {})
+        categories = {
+            'negative': bio_keywords.get('negative', []),
+            'required': bio_keywords.get('required', []),
+            'positive': bio_keywords.get('positive', []),
+            'interests': self.preferences.get('interests', {}).get('preferred', [])
+        }
+        bonuses = {'positive': 0.1, 'interests': 0.05}
+        
+        # word -> [is_negative, is_required, score bonus]
+        effects: Dict[str, list] = {}
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                if keyword:
+                    effect = effects.setdefault(keyword.lower(), [False, False, 0.0])
+                    effect[0] |= category == 'negative'
+                    effect[1] |= category == 'required'
+                    effect[2] += bonuses.get(category, 0.0)
+                    
+        automaton = None
+        if effects:
+            automaton = ahocorasick.Automaton()
+            for word, (is_negative, is_required, bonus) in effects.items():
+                automaton.add_word(word, (word, is_negative, is_required, bonus))
+            automaton.make_automaton()
+        has_required = bool(categories['required'])
+        
+        def score_bio(bio_lower: str) -> float:
+            if automaton is None:
+                return 0.2 if has_required else 0.5
+                
+            score = 0.5  # Start with neutral
+            found_required = False
+            seen = set()
+            for _, (word, is_negative, is_required, bonus) in automaton.iter(bio_lower):
+                # Red flags are an immediate disqualification
+                if is_negative:
+                    logger.debug(f"Found negative keyword: {word}")
+                    return 0.0
+                if word not in seen:
+                    seen.add(word)
+                    found_required |= is_required
+                    score += bonus
+                    
+            if has_required and not found_required:
+                return 0.2  # Low score if missing required keywords
+            return min(score, 1.0)
+            
+        self._bio_scorer = score_bio
+        
     def _initialize_image_model(self):
-        """Initialize pre-trained ResNet model for image feature extraction"""
-        model = models.resnet50(pretrained=True)
+        """Initialize pre-trained backbone for image feature extraction
+        
+        ResNet50 (2048-D) by default; performance.image_backbone = 'mobilenet_v3_large'
+        selects a ~20x cheaper 960-D extractor. Each backbone has its own feature cache,
+        so switching never mixes embeddings
+        """
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        
+        backbone = self.pref_manager.get_all_preferences().get('performance', {}).get('image_backbone', 'resnet50')
+        if backbone not in _IMAGE_BACKBONES:
+            logger.warning(f"Unknown image backbone '{backbone}', using resnet50")
+            backbone = 'resnet50'
+        self.image_backbone = backbone
+        self.feature_cache_dir = self.FEATURE_CACHE_ROOT / f"profile_{backbone}_cv2"
+        
+        constructor, weights = _IMAGE_BACKBONES[backbone]
+        model = constructor(weights=None)
+        model.load_state_dict(self._load_image_model_weights(backbone, weights))
         # Remove the final classification layer
-        model = torch.nn.Sequential(*list(model.children())[:-1])
+        if backbone == 'resnet50':
+            model = torch.nn.Sequential(*list(model.children())[:-1])
+        else:
+            model.classifier = torch.nn.Identity()
         model.eval()
-        return model
+        model = model.to(self.device)
+        if self.device == "cuda":
+            # Tensor cores prefer NHWC layout and fp16 operands
+            model = model.to(memory_format=torch.channels_last).half()
+        
+        # Trace, freeze and optimize once so inference runs the fused graph without Python dispatch
+        try:
+            with torch.no_grad():
+                traced = torch.jit.trace(model, self._prepare_image_batch(torch.zeros(1, 3, 224, 224)))
+            return torch.jit.optimize_for_inference(torch.jit.freeze(traced))
+        except Exception as e:
+            logger.warning(f"TorchScript tracing failed, using eager model: {e}")
+            return model
+        
+    def _load_image_model_weights(self, backbone: str, weights) -> Dict[str, torch.Tensor]:
+        """Load ImageNet backbone weights from the local cache, downloading them only on first run
+        
+        The cached state dict is memory-mapped, so tensors are paged in from disk
+        instead of copied and can share page cache across processes
+        """
+        weights_file = self.IMAGE_MODEL_WEIGHTS_DIR / f"{backbone}_{weights.name.lower()}.pt"
+        if weights_file.exists():
+            try:
+                return torch.load(weights_file, map_location='cpu', mmap=True, weights_only=True)
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable model weights {weights_file}: {e}")
+                
+        state_dict = weights.get_state_dict(progress=False)
+        try:
+            weights_file.parent.mkdir(parents=True, exist_ok=True)
+            torch.save(state_dict, weights_file)
+        except OSError as e:
+            logger.debug(f"Failed to cache model weights {weights_file}: {e}")
+        return state_dict
+        
+    def _prepare_image_batch(self, batch: torch.Tensor) -> torch.Tensor:
+        """Move an image batch to the model's device, layout and precision"""
+        if self.device == "cuda":
+            return batch.to(self.device, memory_format=torch.channels_last, non_blocking=True).half()
+        return batch
+        
+    def _forward_image_batch(self, batch: torch.Tensor) -> np.ndarray:
+        """Run the feature extractor on an (N, 3, 224, 224) batch, returning (N, D) float32"""
+        with torch.inference_mode():
+            features = self.image_model(self._prepare_image_batch(batch))
+        return features.flatten(1).float().cpu().numpy()
         
     def _get_image_transform(self):
-        """Get image transformation pipeline"""
-        return transforms.Compose([
-            transforms.Resize(256),
-            transforms.CenterCrop(224),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=[0.485, 0.456, 0.406],
-                               std=[0.229, 0.224, 0.225])
-        ])
+        """Get image transformation pipeline (BGR ndarray -> normalized tensor)"""
+        return fast_transform
         
     def _load_training_examples(self):
         """Load positive and negative example profiles"""
-        # Load liked profiles
-        liked_dir = "config/liked_profiles"
-        if os.path.exists(liked_dir):
-            for img_file in os.listdir(liked_dir):
-                if img_file.endswith(('.jpg', '.png')):
-                    img_path = os.path.join(liked_dir, img_file)
-                    features = self._extract_image_features(img_path)
-                    if features is not None:
-                        self.positive_examples.append(features)
+        # Collect liked and disliked profiles, then extract features in batches
+        examples = []
+        for example_dir, is_positive in (("config/liked_profiles", True), ("config/disliked_profiles", False)):
+            examples.extend((path, is_positive) for path in self._list_images(example_dir))
                         
-        # Load disliked profiles
-        disliked_dir = "config/disliked_profiles"
-        if os.path.exists(disliked_dir):
-            for img_file in os.listdir(disliked_dir):
-                if img_file.endswith(('.jpg', '.png')):
-                    img_path = os.path.join(disliked_dir, img_file)
-                    features = self._extract_image_features(img_path)
-                    if features is not None:
-                        self.negative_examples.append(features)
+        features_list = self._extract_features_batch([path for path, _ in examples])
+        for (_, is_positive), features in zip(examples, features_list):
+            if features is not None:
+                if is_positive:
+                    self.positive_examples.append(features)
+                else:
+                    self.negative_examples.append(features)
                         
         logger.info(f"Loaded {len(self.positive_examples)} positive and {len(self.negative_examples)} negative examples")
         
+    @staticmethod
+    def _list_images(directory: str) -> List[str]:
+        """List image files in a training example directory"""
+        if not os.path.isdir(directory):
+            return []
+        with os.scandir(directory) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if os.path.splitext(entry.name)[1].lower() in _IMAGE_EXTENSIONS
+                and entry.is_file(follow_symlinks=False)
+            ]
+            
     def _load_reference_features(self):
         """Load user-provided reference images and extract features"""
         try:
             reference_images = self.pref_manager.get_reference_images()
             self.reference_features = []
             
-            for ref_img in reference_images:
-                features = self._extract_image_features(ref_img['file_path'])
+            features_list = self._extract_features_batch([ref_img['file_path'] for ref_img in reference_images])
+            for ref_img, features in zip(reference_images, features_list):
                 if features is not None:
                     self.reference_features.append({
                         'features': features,
@@ -122,29 +357,197 @@ class ProfileAnalyzer:
         except Exception as e:
             logger.warning(f"Failed to load reference features: {e}")
         
-    def _extract_image_features(self, image_path: str) -> Optional[np.ndarray]:
-        """Extract feature vector from image using ResNet"""
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize each row in place, leaving all-zero rows untouched"""
+        norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix
+        
+    @classmethod
+    def _quantize(cls, matrix: np.ndarray) -> np.ndarray:
+        """Quantize feature rows to int8
+        
+        Rows are L2-normalized first so every component lies in [-1, 1] and one
+        fixed scale of 127 fits all of them; cosine is scale invariant, so no
+        per-row scale has to be kept
+        """
+        normalized = cls._normalize_rows(np.array(matrix, dtype=np.float32))
+        return np.ascontiguousarray(np.round(normalized * 127.0), dtype=np.int8)
+        
+    @classmethod
+    def _stack_features(cls, vectors: List[np.ndarray]) -> Optional[np.ndarray]:
+        """Stack feature vectors into one contiguous, int8-quantized (N, D) matrix"""
+        if not vectors:
+            return None
+        return cls._quantize(np.stack(vectors))
+        
+    @staticmethod
+    def _cosine_similarities(matrix: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Cosine similarity of every int8 row of matrix to a (1, D) quantized query using SimSIMD kernels
+        
+        Rows and query are unit vectors scaled by 127, so cosine is an int8 dot
+        product divided by 127^2
+        """
+        dots = simsimd.cdist(matrix, query, metric='dot', dtype='i8')
+        return np.asarray(dots, dtype=np.float32).ravel() * (1.0 / (127.0 * 127.0))
+        
+    def _build_example_matrices(self):
+        """Pack reference and training features into matrices so scoring is one GEMV per set"""
+        self.ref_mat = self._stack_features([ref['features'] for ref in self.reference_features])
+        self._build_training_matrix()
+        
+    def _build_training_matrix(self):
+        """Pack liked and disliked example features into the training matrix"""
+        # Negatives only matter alongside positives, so both live in one matrix scored
+        # with a single kernel call: rows [:num_positive] are liked, the rest disliked
+        # example_mat is a view over the first rows of a larger buffer so appends are amortized O(1)
+        self.num_positive = len(self.positive_examples)
+        self.example_mat = None
+        self._example_buf = None
+        if self.positive_examples:
+            stacked = self._stack_features(self.positive_examples + self.negative_examples)
+            capacity = max(self.TRAINING_MATRIX_MIN_CAPACITY, 1 << (len(stacked) - 1).bit_length())
+            self._example_buf = np.empty((capacity, stacked.shape[1]), dtype=np.int8)
+            self._example_buf[:len(stacked)] = stacked
+            self.example_mat = self._example_buf[:len(stacked)]
+            
+    def _add_training_row(self, features: np.ndarray, liked: bool):
+        """Normalize and quantize one new example into the training matrix without repacking the others"""
+        if self._example_buf is None:
+            self._build_training_matrix()
+            return
+            
+        count = len(self.example_mat)
+        if count == len(self._example_buf):
+            grown = np.empty((2 * count, self._example_buf.shape[1]), dtype=np.int8)
+            grown[:count] = self._example_buf
+            self._example_buf = grown
+            
+        row = self._quantize(features.reshape(1, -1))[0]
+        if liked:
+            # Only the block means matter, so the first disliked row moves to the end to make room
+            self._example_buf[count] = self._example_buf[self.num_positive]
+            self._example_buf[self.num_positive] = row
+            self.num_positive += 1
+        else:
+            self._example_buf[count] = row
+        self.example_mat = self._example_buf[:count + 1]
+        
+    def _feature_cache_file(self, image_path: str, data: Optional[bytes] = None) -> Optional[Path]:
+        """Cache location for an image's features, keyed by a hash of its bytes"""
+        try:
+            if data is None:
+                data = Path(image_path).read_bytes()
+        except OSError:
+            return None
+        content_key = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return self.feature_cache_dir / f"{content_key}.npy"
+        
+    @staticmethod
+    def _load_cached_features(cache_file: Optional[Path]) -> Optional[np.ndarray]:
+        """Load cached features, returning None on a miss or unreadable entry"""
+        if cache_file is None or not cache_file.exists():
+            return None
         try:
-            image = Image.open(image_path).convert('RGB')
-            image_tensor = self.transform(image).unsqueeze(0)
+            return np.load(cache_file)
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable feature cache {cache_file}: {e}")
+            return None
             
-            with torch.no_grad():
-                features = self.image_model(image_tensor)
-                features = features.squeeze().numpy()
-                
+    @staticmethod
+    def _save_cached_features(cache_file: Optional[Path], features: np.ndarray):
+        """Write features to the on-disk cache, ignoring failures"""
+        if cache_file is None:
+            return
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            np.save(cache_file, features)
+        except OSError as e:
+            logger.debug(f"Failed to write feature cache {cache_file}: {e}")
+            
+    def _extract_image_features(self, image_path: str, image_bgr: Optional[np.ndarray] = None,
+                                data: Optional[bytes] = None) -> Optional[np.ndarray]:
+        """Extract feature vector from image using ResNet
+        
+        Callers that already hold the file bytes and decoded BGR image can pass them to skip re-reading the file
+        """
+        cache_file = self._feature_cache_file(image_path, data)
+        features = self._load_cached_features(cache_file)
+        if features is not None:
             return features
+            
+        try:
+            if image_bgr is None:
+                image_bgr = cv2.imread(image_path, cv2.IMREAD_COLOR)
+                if image_bgr is None:
+                    raise ValueError("could not decode image")
+            self._input_buf[0].copy_(self.transform(image_bgr))
+            features = self._forward_image_batch(self._input_buf)[0]
         except Exception as e:
             logger.error(f"Failed to extract features from {image_path}: {e}")
             return None
             
+        self._save_cached_features(cache_file, features)
+        return features
+            
+    def _extract_features_batch(self, image_paths: List[str], batch_size: int = 32) -> List[Optional[np.ndarray]]:
+        """Extract ResNet features for many images, one forward pass per batch
+        
+        Cached features are reused; only new or changed files go through the model.
+        Returns a list aligned with image_paths; entries are None for unreadable images
+        """
+        features: List[Optional[np.ndarray]] = [None] * len(image_paths)
+        cache_files = [self._feature_cache_file(path) for path in image_paths]
+        
+        pending = []
+        for i, cache_file in enumerate(cache_files):
+            features[i] = self._load_cached_features(cache_file)
+            if features[i] is None:
+                pending.append(i)
+                
+        if not pending:
+            return features
+            
+        # Decode and transform in worker processes while the main process runs the model;
+        # worker start-up only pays off once there is more than one batch
+        num_workers = max(1, (os.cpu_count() or 2) // 2) if len(pending) > batch_size else 0
+        loader = DataLoader(
+            _ImageDirDataset([image_paths[i] for i in pending], self.transform),
+            batch_size=batch_size,
+            num_workers=num_workers,
+            pin_memory=torch.cuda.is_available(),
+            collate_fn=_collate_images
+        )
+        
+        for indices, batch in loader:
+            if batch is None:
+                continue
+                
+            batch_features = self._forward_image_batch(batch)
+                
+            for row, index in enumerate(indices):
+                i = pending[index]
+                features[i] = batch_features[row]
+                self._save_cached_features(cache_files[i], features[i])
+                
+        return features
+            
     def analyze_screenshot(self, screenshot_path: str) -> Dict:
-        """Analyze a screenshot to make swipe decision using enhanced preference system"""
+        """Analyze a screenshot to make swipe decision using enhanced preference system
+        
+        OCR and image analysis run concurrently. A bio containing a negative keyword
+        or dealbreaker interest as a whole word is an immediate 'left' with confidence
+        0.0; the image score is then discarded (reported as 0.0, with 'skipped'
+        listing it)
+        """
         logger.info(f"Analyzing screenshot: {screenshot_path}")
         
-        # Extract bio text
-        bio_text = self._extract_bio_text(screenshot_path)
+        # Read and decode once; OCR and the image model share the decoded pixels
+        data, image = self._load_screenshot(screenshot_path)
         
-        # Get preference weights (with fallback to old system)
+        # Get preference weights (with fallback to old system); this snapshot is shared by every helper below
         prefs = self.pref_manager.get_all_preferences()
         if 'partner_preferences' in prefs:
             physical_weight = prefs['partner_preferences']['physical']['importance_weight']
@@ -156,10 +559,38 @@ class ProfileAnalyzer:
             personality_weight = 0.3
             interest_weight = 0.1
         
-        # Analyze different aspects
-        image_score = self._analyze_profile_image(screenshot_path)
-        bio_score = self._analyze_bio_enhanced(bio_text)
-        interest_score = self._analyze_interests(bio_text)
+        weights = {
+            'physical': physical_weight,
+            'personality': personality_weight,
+            'interests': interest_weight
+        }
+        
+        # OCR runs in the background while the image model scores the photo;
+        # Tesseract and torch both release the GIL
+        bio_future = self._get_executor().submit(self._extract_bio_text, screenshot_path, image)
+        image_score = self._analyze_profile_image(screenshot_path, image, data)
+        bio_text = bio_future.result()
+        
+        # Lowercase once; every keyword helper below matches against it
+        bio_lower = bio_text.lower()
+        bio_score = self._analyze_bio_enhanced(bio_text, prefs, bio_lower)
+        interest_score = self._analyze_interests(bio_text, prefs, bio_lower)
+        
+        if self._is_disqualified(bio_text, prefs):
+            logger.info("Decision: left (dealbreaker in bio, image score discarded)")
+            return {
+                'decision': 'left',
+                'confidence': 0.0,
+                'scores': {
+                    'physical': 0.0,
+                    'personality': bio_score,
+                    'interests': interest_score
+                },
+                'skipped': ['physical'],
+                'weights': weights,
+                'bio_text': bio_text[:200],
+                'reasons': ["Bio contains one of your dealbreakers", "Photo not scored"]
+            }
         
         # Calculate weighted final score
         final_score = (
@@ -189,85 +620,145 @@ class ProfileAnalyzer:
                 'personality': bio_score,
                 'interests': interest_score
             },
-            'weights': {
-                'physical': physical_weight,
-                'personality': personality_weight,
-                'interests': interest_weight
-            },
+            'weights': weights,
             'bio_text': bio_text[:200] if bio_text else None,
-            'reasons': self._generate_enhanced_reasons(image_score, bio_score, interest_score, bio_text)
+            'reasons': self._generate_enhanced_reasons(image_score, bio_score, interest_score, bio_text, prefs,
+                                                       bio_lower)
         }
         
         logger.info(f"Decision: {decision} (confidence: {final_score:.2f})")
         return result
         
-    def _extract_bio_text(self, screenshot_path: str) -> str:
+    def _get_tess_api(self) -> PyTessBaseAPI:
+        """Get this thread's long-lived Tesseract API, creating it on first use
+        
+        A Tesseract handle is not thread-safe, so each OCR thread gets its own. The
+        bio region is already a single text block, so page layout analysis is skipped
+        """
+        local = self.__dict__.setdefault('_tess_local', threading.local())
+        tess_api = getattr(local, 'api', None)
+        if tess_api is None:
+            tess_api = PyTessBaseAPI(lang='eng', psm=PSM.SINGLE_BLOCK, oem=OEM.LSTM_ONLY)
+            local.api = tess_api
+            self.__dict__.setdefault('_tess_apis', []).append(tess_api)
+        return tess_api
+        
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the persistent thread pool used to overlap OCR with image analysis"""
+        executor = self.__dict__.get('_executor')
+        if executor is None:
+            executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='profile-analyzer')
+            self._executor = executor
+        return executor
+        
+    def close(self):
+        """Shut down the background OCR thread pool and release all Tesseract API handles"""
+        executor = self.__dict__.pop('_executor', None)
+        if executor is not None:
+            executor.shutdown(wait=True)
+        for tess_api in self.__dict__.pop('_tess_apis', []):
+            tess_api.End()
+        self.__dict__.pop('_tess_local', None)
+            
+    def __del__(self):
+        self.close()
+        
+    @staticmethod
+    def _load_screenshot(screenshot_path: str) -> Tuple[Optional[bytes], Optional[np.ndarray]]:
+        """Read a screenshot's bytes and decode them to BGR, returning None for whatever failed"""
+        try:
+            data = Path(screenshot_path).read_bytes()
+        except OSError as e:
+            logger.error(f"Failed to read screenshot {screenshot_path}: {e}")
+            return None, None
+        if not data:
+            # imdecode asserts on an empty buffer instead of returning None
+            logger.error(f"Screenshot {screenshot_path} is empty")
+            return None, None
+        return data, cv2.imdecode(np.frombuffer(data, dtype=np.uint8), cv2.IMREAD_COLOR)
+        
+    def _is_disqualified(self, bio_text: str, prefs: Dict) -> bool:
+        """Whether a bio contains a negative keyword or dealbreaker interest as a whole word
+        
+        Stricter than the substring matching used for scoring, since a hit here
+        rejects the profile outright
+        """
+        if not bio_text:
+            return False
+        keywords = (tuple(self.preferences.get('bio_keywords', {}).get('negative', [])) +
+                    tuple(prefs.get('partner_preferences', {}).get('interests', {}).get('dealbreaker_interests', [])))
+        pattern = _compile_red_flag_pattern(keywords)
+        return pattern is not None and pattern.search(bio_text) is not None
+        
+    def _extract_bio_text(self, screenshot_path: str, image: Optional[np.ndarray] = None) -> str:
         """Extract bio text from screenshot using OCR"""
         try:
-            # Read image
-            image = cv2.imread(screenshot_path)
+            # Read image unless the caller already decoded it; OCR only needs one channel
+            if image is None:
+                image = cv2.imread(screenshot_path, cv2.IMREAD_GRAYSCALE)
             
             # Define approximate bio region (adjust based on actual layout)
             height, width = image.shape[:2]
             bio_region = image[int(height*0.4):int(height*0.8), int(width*0.1):int(width*0.9)]
             
+            # Convert only the cropped band, and everything after works on one channel
+            if bio_region.ndim == 3:
+                bio_region = cv2.cvtColor(bio_region, cv2.COLOR_BGR2GRAY)
+            
+            # Repeat screenshots of the same profile skip Tesseract entirely
+            cache_key = self._bio_region_key(bio_region)
+            with self._ocr_cache_lock:
+                text = self._ocr_cache.get(cache_key)
+                if text is not None:
+                    self._ocr_cache.move_to_end(cache_key)
+                    return text
+            
+            # OCR cost scales with pixel count; full-resolution phone text is far larger than needed
+            if min(bio_region.shape[:2]) > self.OCR_DOWNSCALE_MIN_SIDE:
+                bio_region = cv2.resize(bio_region, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+            
             # Preprocess for better OCR
-            gray = cv2.cvtColor(bio_region, cv2.COLOR_BGR2GRAY)
-            thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)[1]
+            thresh = cv2.adaptiveThreshold(bio_region, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10)
             
-            # Extract text
-            text = pytesseract.image_to_string(thresh)
+            # Extract text in-process with this thread's persistent Tesseract handle
+            tess_api = self._get_tess_api()
+            tess_api.SetImage(Image.fromarray(thresh))
+            text = tess_api.GetUTF8Text()
             
             # Clean up text
             text = ' '.join(text.split())
             
+            with self._ocr_cache_lock:
+                self._ocr_cache[cache_key] = text
+                while len(self._ocr_cache) > self.OCR_CACHE_SIZE:
+                    self._ocr_cache.popitem(last=False)
+            
             return text
             
         except Exception as e:
             logger.error(f"Failed to extract bio text: {e}")
             return ""
             
-    def _analyze_bio(self, bio_text: str) -> float:
+    @staticmethod
+    def _bio_region_key(bio_region: np.ndarray) -> str:
+        """Cache key for a cropped bio region: a hash of its exact pixels and shape"""
+        digest = hashlib.blake2b(np.ascontiguousarray(bio_region).data, digest_size=16)
+        digest.update(str(bio_region.shape).encode())
+        return digest.hexdigest()
+            
+    def _analyze_bio(self, bio_text: str, bio_lower: Optional[str] = None) -> float:
         """Analyze bio text and return score"""
         if not bio_text:
             return 0.5  # Neutral score if no bio
             
-        bio_lower = bio_text.lower()
-        score = 0.5  # Start with neutral
-        
-        # Check for red flags (immediate disqualification)
-        for keyword in self.preferences['bio_keywords']['negative']:
-            if keyword.lower() in bio_lower:
-                logger.debug(f"Found negative keyword: {keyword}")
-                return 0.0
-                
-        # Check required keywords
-        required = self.preferences['bio_keywords'].get('required', [])
-        if required:
-            has_required = any(kw.lower() in bio_lower for kw in required)
-            if not has_required:
-                return 0.2  # Low score if missing required keywords
-                
-        # Check positive keywords
-        for keyword in self.preferences['bio_keywords']['positive']:
-            if keyword.lower() in bio_lower:
-                score += 0.1
-                logger.debug(f"Found positive keyword: {keyword}")
-                
-        # Check interests
-        interests = self.preferences.get('interests', {}).get('preferred', [])
-        for interest in interests:
-            if interest.lower() in bio_lower:
-                score += 0.05
-                
-        # Cap at 1.0
-        return min(score, 1.0)
+        return self._bio_scorer(bio_text.lower() if bio_lower is None else bio_lower)
         
-    def _analyze_profile_image(self, screenshot_path: str) -> float:
+    def _analyze_profile_image(self, screenshot_path: str, image: Optional[np.ndarray] = None,
+                               data: Optional[bytes] = None) -> float:
         """Analyze profile image and return similarity score using multiple methods"""
         try:
             # Extract features from screenshot
-            features = self._extract_image_features(screenshot_path)
+            features = self._extract_image_features(screenshot_path, image, data)
             
             if features is None:
                 return 0.5  # Neutral score if can't extract features
@@ -275,43 +766,24 @@ class ProfileAnalyzer:
             scores = []
             weights = []
             
+            # Quantize the query once; every set is then a single SimSIMD kernel call
+            query = self._quantize(features.reshape(1, -1))
+            
             # Method 1: Reference image similarity (highest priority)
-            if self.reference_features:
-                ref_similarities = []
-                for ref_data in self.reference_features:
-                    sim = cosine_similarity(
-                        features.reshape(1, -1),
-                        ref_data['features'].reshape(1, -1)
-                    )[0][0]
-                    ref_similarities.append(sim)
-                    
-                avg_ref_similarity = np.mean(ref_similarities)
+            if self.ref_mat is not None:
+                avg_ref_similarity = float(self._cosine_similarities(self.ref_mat, query).mean())
                 scores.append(avg_ref_similarity)
                 weights.append(0.7)  # High weight for reference images
                 logger.debug(f"Reference similarity: {avg_ref_similarity:.3f}")
             
             # Method 2: Training examples (medium priority)
-            if self.positive_examples:
-                pos_similarities = []
-                for pos_example in self.positive_examples:
-                    sim = cosine_similarity(
-                        features.reshape(1, -1),
-                        pos_example.reshape(1, -1)
-                    )[0][0]
-                    pos_similarities.append(sim)
-                    
-                avg_pos_similarity = np.mean(pos_similarities)
+            if self.example_mat is not None:
+                example_similarities = self._cosine_similarities(self.example_mat, query)
+                avg_pos_similarity = float(example_similarities[:self.num_positive].mean())
                 
                 # Factor in negative examples if available
-                if self.negative_examples:
-                    neg_similarities = []
-                    for neg_example in self.negative_examples:
-                        sim = cosine_similarity(
-                            features.reshape(1, -1),
-                            neg_example.reshape(1, -1)
-                        )[0][0]
-                        neg_similarities.append(sim)
-                    avg_neg_similarity = np.mean(neg_similarities)
+                if len(example_similarities) > self.num_positive:
+                    avg_neg_similarity = float(example_similarities[self.num_positive:].mean())
                     
                     # Relative scoring
                     training_score = (avg_pos_similarity - avg_neg_similarity + 1) / 2
@@ -344,6 +816,9 @@ class ProfileAnalyzer:
     def update_preferences(self, new_preferences: Dict):
         """Update user preferences"""
         self.preferences.update(new_preferences)
+        self._compile_bio_matcher()
+        with self._ocr_cache_lock:
+            self._ocr_cache.clear()
         # Save to file
         with open("config/preferences.json", 'w') as f:
             json.dump(self.preferences, f, indent=2)
@@ -366,15 +841,19 @@ class ProfileAnalyzer:
                 filename = os.path.basename(image_path)
                 Image.open(image_path).save(f"config/disliked_profiles/{filename}")
                 
+            self._add_training_row(features, liked)
             logger.info(f"Added training example: {'liked' if liked else 'disliked'}")
     
-    def _analyze_bio_enhanced(self, bio_text: str) -> float:
+    def _analyze_bio_enhanced(self, bio_text: str, prefs: Optional[Dict] = None,
+                              bio_lower: Optional[str] = None) -> float:
         """Enhanced bio analysis using new preference system"""
         if not bio_text:
             return 0.5
             
-        prefs = self.pref_manager.get_all_preferences()
-        bio_lower = bio_text.lower()
+        if prefs is None:
+            prefs = self.pref_manager.get_all_preferences()
+        if bio_lower is None:
+            bio_lower = bio_text.lower()
         score = 0.5
         
         # Check personality traits if specified
@@ -382,24 +861,26 @@ class ProfileAnalyzer:
             personality_prefs = prefs['partner_preferences']['personality']
             traits = personality_prefs.get('traits', [])
             
-            for trait in traits:
-                if trait.lower() in bio_lower:
-                    score += 0.15
-                    logger.debug(f"Found desired trait: {trait}")
+            for trait in _find_keywords(traits, bio_lower):
+                score += 0.15
+                logger.debug(f"Found desired trait: {trait}")
         
         # Fall back to old bio analysis
-        old_score = self._analyze_bio(bio_text)
+        old_score = self._analyze_bio(bio_text, bio_lower)
         
         # Combine scores
         return min(1.0, (score + old_score) / 2)
     
-    def _analyze_interests(self, bio_text: str) -> float:
+    def _analyze_interests(self, bio_text: str, prefs: Optional[Dict] = None,
+                           bio_lower: Optional[str] = None) -> float:
         """Analyze interests based on new preference system"""
         if not bio_text:
             return 0.5
             
-        prefs = self.pref_manager.get_all_preferences()
-        bio_lower = bio_text.lower()
+        if prefs is None:
+            prefs = self.pref_manager.get_all_preferences()
+        if bio_lower is None:
+            bio_lower = bio_text.lower()
         score = 0.5
         
         if 'partner_preferences' in prefs:
@@ -407,21 +888,21 @@ class ProfileAnalyzer:
             
             # Check for shared interests
             shared_interests = interest_prefs.get('shared_interests', [])
-            for interest in shared_interests:
-                if interest.lower() in bio_lower:
-                    score += 0.2
-                    logger.debug(f"Found shared interest: {interest}")
+            for interest in _find_keywords(shared_interests, bio_lower):
+                score += 0.2
+                logger.debug(f"Found shared interest: {interest}")
             
             # Check for dealbreaker interests
             dealbreakers = interest_prefs.get('dealbreaker_interests', [])
-            for dealbreaker in dealbreakers:
-                if dealbreaker.lower() in bio_lower:
-                    return 0.0  # Immediate disqualification
+            if _find_keywords(dealbreakers, bio_lower):
+                return 0.0  # Immediate disqualification
         
         return min(1.0, score)
     
     def _generate_enhanced_reasons(self, image_score: float, bio_score: float, 
-                                 interest_score: float, bio_text: str) -> List[str]:
+                                 interest_score: float, bio_text: str,
+                                 prefs: Optional[Dict] = None,
+                                 bio_lower: Optional[str] = None) -> List[str]:
         """Generate enhanced reasons for the decision"""
         reasons = []
         
@@ -448,13 +929,14 @@ class ProfileAnalyzer:
         
         # Specific interest mentions
         if bio_text:
-            prefs = self.pref_manager.get_all_preferences()
+            if prefs is None:
+                prefs = self.pref_manager.get_all_preferences()
             if 'partner_preferences' in prefs:
                 shared_interests = prefs['partner_preferences']['interests'].get('shared_interests', [])
-                bio_lower = bio_text.lower()
+                if bio_lower is None:
+                    bio_lower = bio_text.lower()
                 
-                for interest in shared_interests:
-                    if interest.lower() in bio_lower:
-                        reasons.append(f"Shares your interest in {interest}")
+                for interest in _find_keywords(shared_interests, bio_lower):
+                    reasons.append(f"Shares your interest in {interest}")
         
         return reasons
\ No newline at end of file
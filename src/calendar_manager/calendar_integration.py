@@ -4,22 +4,110 @@ Checks availability and creates events
 """
 
 import os
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
-import caldav
-from icalendar import Calendar, Event
+import numpy as np
 import pytz
 from loguru import logger
 import json
 
 
+_WEEKDAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+# Fixed-schema date event, formatted directly instead of built through icalendar
+_ICS_TEMPLATE = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//DatingWizard//EN\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:{uid}\r\n"
+    "DTSTAMP:{stamp}\r\n"
+    "DTSTART{start}\r\n"
+    "DTEND{end}\r\n"
+    "{summary}\r\n"
+    "{location}\r\n"
+    "{description}\r\n"
+    "BEGIN:VALARM\r\n"
+    "TRIGGER:-PT30M\r\n"
+    "ACTION:DISPLAY\r\n"
+    "DESCRIPTION:Reminder\r\n"
+    "END:VALARM\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+# RFC 5545 TEXT escaping
+_ICS_ESCAPES = str.maketrans({'\\': '\\\\', ';': '\\;', ',': '\\,', '\n': '\\n'})
+
+
+def _ics_text_line(name: str, value: str) -> str:
+    """Escaped TEXT property line, folded so no line exceeds 75 octets of UTF-8"""
+    line = f"{name}:{value.translate(_ICS_ESCAPES)}"
+    if len(line.encode('utf-8')) <= 75:
+        return line
+        
+    # Continuation lines start with a space, leaving 74 octets; never split a character
+    chunks, chunk, size, limit = [], [], 0, 75
+    for char in line:
+        width = len(char.encode('utf-8'))
+        if size + width > limit:
+            chunks.append(''.join(chunk))
+            chunk, size, limit = [], 0, 74
+        chunk.append(char)
+        size += width
+    chunks.append(''.join(chunk))
+    return "\r\n ".join(chunks)
+
+
+def _ics_datetime(value: datetime, tz) -> str:
+    """DATE-TIME value (with leading parameters and ':') as wall time in the given pytz zone
+    
+    Written with TZID rather than converted to UTC, so a datetime whose offset
+    predates a DST change still lands on its intended local time
+    """
+    if value.tzinfo is None:
+        return value.strftime(':%Y%m%dT%H%M%S')
+    if getattr(value.tzinfo, 'zone', None) != tz.zone:
+        value = value.astimezone(tz)
+    return value.strftime(f';TZID={tz.zone}:%Y%m%dT%H%M%S')
+
+
 class CalendarManager:
     """Manages calendar integration for date scheduling"""
     
+    # Availability and upcoming-date lookups are reused for this many seconds
+    CACHE_TTL_SECONDS = 300
+    CACHE_SIZE = 16
+    
+    # Discovered calendar URLs are reused across runs to skip principal discovery
+    CALENDAR_LIST_CACHE = os.path.join('cache', 'calendars.json')
+    CALENDAR_LIST_TTL_SECONDS = 24 * 3600
+    
+    # Used when the preferences file has no date_preferences (or omits these keys)
+    DEFAULT_PREFERRED_DAYS = ["Friday", "Saturday", "Sunday"]
+    DEFAULT_PREFERRED_TIMES = ["18:00-21:00", "11:00-14:00"]
+    
     def __init__(self, preferences_path: str = "config/preferences.json"):
         self.preferences = self._load_preferences(preferences_path)
+        # Parse preferred slots once instead of on every availability lookup
+        self._time_ranges = [(time_range, *self._parse_time_range(time_range))
+                             for time_range in self.preferences.get('preferred_times', self.DEFAULT_PREFERRED_TIMES)]
+        self._preferred_days = set(self.preferences.get('preferred_days', self.DEFAULT_PREFERRED_DAYS))
+        self._preferred_weekdays = np.array([i for i, name in enumerate(_WEEKDAY_NAMES)
+                                             if name in self._preferred_days], dtype=np.int64)
+        # Slot (start, end) as seconds after midnight, one row per preferred time range
+        self._slot_offsets = np.array([(start[0] * 3600 + start[1] * 60, end[0] * 3600 + end[1] * 60)
+                                       for _, start, end in self._time_ranges],
+                                      dtype=np.float64).reshape(-1, 2)
         self.client = None
         self.calendar = None
+        self.calendars = []
+        self._use_freebusy = False
+        self._cache = OrderedDict()
         self.timezone = pytz.timezone('America/Los_Angeles')  # Default, update as needed
         self._setup_calendar_connection()
         
@@ -29,8 +117,8 @@ class CalendarManager:
             with open(path, 'r') as f:
                 return json.load(f).get('date_preferences', {})
         return {
-            "preferred_days": ["Friday", "Saturday", "Sunday"],
-            "preferred_times": ["18:00-21:00", "11:00-14:00"],
+            "preferred_days": list(self.DEFAULT_PREFERRED_DAYS),
+            "preferred_times": list(self.DEFAULT_PREFERRED_TIMES),
             "preferred_activities": ["coffee", "drinks", "dinner"]
         }
         
@@ -46,19 +134,28 @@ class CalendarManager:
                 logger.warning("Calendar credentials not found in environment")
                 return
                 
+            # Imported here so the fallback path (no credentials) never loads the CalDAV stack
+            import caldav
+            
             # Connect to CalDAV server
             self.client = caldav.DAVClient(
                 url=calendar_url,
                 username=username,
                 password=password
             )
+            self._configure_session()
             
-            # Get principal calendar
-            principal = self.client.principal()
-            calendars = principal.calendars()
+            # Get principal calendars, from the on-disk list when it is fresh
+            calendars = self._load_cached_calendars(calendar_url, username)
+            if calendars is None:
+                principal = self.client.principal()
+                calendars = principal.calendars()
+                self._save_cached_calendars(calendar_url, username, calendars)
             
             if calendars:
-                self.calendar = calendars[0]  # Use first calendar
+                self.calendar = calendars[0]  # New events go to the first calendar
+                self.calendars = calendars  # Availability considers all of them
+                self._use_freebusy = self._supports_freebusy()
                 logger.success("Connected to calendar successfully")
             else:
                 logger.warning("No calendars found")
@@ -66,49 +163,147 @@ class CalendarManager:
         except Exception as e:
             logger.error(f"Failed to connect to calendar: {e}")
             
+    def _load_cached_calendars(self, calendar_url: str, username: str) -> Optional[List]:
+        """Calendars rebuilt from cached URLs, or None if the cache is missing or stale"""
+        try:
+            with open(self.CALENDAR_LIST_CACHE, 'r') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            return None
+            
+        if (cached.get('server') != calendar_url or cached.get('username') != username
+                or time.time() - cached.get('saved_at', 0) > self.CALENDAR_LIST_TTL_SECONDS
+                or not cached.get('urls')):
+            return None
+            
+        import caldav
+        return [caldav.Calendar(client=self.client, url=url) for url in cached['urls']]
+        
+    def _save_cached_calendars(self, calendar_url: str, username: str, calendars: List):
+        """Persist discovered calendar URLs for the next start"""
+        try:
+            os.makedirs(os.path.dirname(self.CALENDAR_LIST_CACHE), exist_ok=True)
+            with open(self.CALENDAR_LIST_CACHE, 'w') as f:
+                json.dump({
+                    'server': calendar_url,
+                    'username': username,
+                    'saved_at': time.time(),
+                    'urls': [str(calendar.url) for calendar in calendars]
+                }, f)
+        except OSError as e:
+            logger.debug(f"Could not cache calendar list: {e}")
+            
+    def _invalidate_calendar_list_cache(self):
+        """Forget cached calendar URLs, e.g. after a calendar disappeared on the server"""
+        try:
+            os.remove(self.CALENDAR_LIST_CACHE)
+        except OSError:
+            pass
+            
+    def _configure_session(self):
+        """Reuse pooled keep-alive connections (and retry transient 5xx) for all CalDAV requests"""
+        try:
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=8,
+                max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            self.client.session.mount('https://', adapter)
+            self.client.session.mount('http://', adapter)
+            self.client.session.headers['Connection'] = 'keep-alive'
+        except Exception as e:
+            logger.debug(f"Could not configure CalDAV connection pooling: {e}")
+            
+    def _get_cached(self, key) -> Optional[List[Dict]]:
+        """Return a copy of a fresh cached result, refreshing LRU order"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.CACHE_TTL_SECONDS:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return [dict(item) for item in value]
+        
+    def _store_cached(self, key, value: List[Dict]):
+        """Store a result in the LRU cache, evicting the oldest entry if full"""
+        self._cache[key] = (time.monotonic(), [dict(item) for item in value])
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+            
+    def invalidate_cache(self):
+        """Drop cached availability and upcoming dates, e.g. after the calendar changes"""
+        self._cache.clear()
+        
     def get_availability(self, days_ahead: int = 7) -> List[Dict]:
-        """Get available time slots for the next N days"""
-        available_slots = []
+        """Get available time slots for the next N days
         
+        Results are cached for CACHE_TTL_SECONDS; events created through this
+        manager invalidate the cache immediately
+        """
         # Get current date
         today = datetime.now(self.timezone)
         
-        for days in range(1, days_ahead + 1):
-            check_date = today + timedelta(days=days)
+        cache_key = ('availability', days_ahead, today.date())
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return cached
+            
+        available_slots = []
+        
+        midnight = today.replace(hour=0, minute=0, second=0, microsecond=0)
+        
+        # Fetch every busy interval for the whole horizon in one request instead of one per slot
+        busy = self._fetch_busy_intervals(
+            midnight + timedelta(days=1),
+            midnight + timedelta(days=days_ahead + 1)
+        )
+        
+        # Epoch start/end of every candidate slot, shape (days, slots)
+        day_offsets = np.arange(1, days_ahead + 1)
+        day_starts = midnight.timestamp() + day_offsets[:, None] * 86400.0
+        starts = day_starts + self._slot_offsets[:, 0]
+        ends = day_starts + self._slot_offsets[:, 1]
+        
+        preferred = np.isin((today.weekday() + day_offsets) % 7, self._preferred_weekdays)
+        free = preferred[:, None] & ~self._overlaps_busy(busy, starts, ends)
+        
+        # Only the free slots are materialized as datetimes, in day-then-time order
+        for day_index, slot_index in zip(*np.nonzero(free)):
+            check_date = today + timedelta(days=int(day_offsets[day_index]))
             day_name = check_date.strftime('%A')
+            time_range, start_hour, end_hour = self._time_ranges[slot_index]
+            
+            # Create datetime objects for the slot
+            slot_start = check_date.replace(
+                hour=start_hour[0],
+                minute=start_hour[1],
+                second=0,
+                microsecond=0
+            )
+            slot_end = check_date.replace(
+                hour=end_hour[0],
+                minute=end_hour[1],
+                second=0,
+                microsecond=0
+            )
+            
+            available_slots.append({
+                'date': check_date.date(),
+                'day': day_name,
+                'time': time_range,
+                'start': slot_start,
+                'end': slot_end,
+                'formatted': f"{day_name} {check_date.strftime('%B %d')} at {start_hour[0]}:{start_hour[1]:02d}"
+            })
             
-            # Check if this is a preferred day
-            if day_name in self.preferences['preferred_days']:
-                # Check each preferred time slot
-                for time_range in self.preferences['preferred_times']:
-                    start_hour, end_hour = self._parse_time_range(time_range)
-                    
-                    # Create datetime objects for the slot
-                    slot_start = check_date.replace(
-                        hour=start_hour[0],
-                        minute=start_hour[1],
-                        second=0,
-                        microsecond=0
-                    )
-                    slot_end = check_date.replace(
-                        hour=end_hour[0],
-                        minute=end_hour[1],
-                        second=0,
-                        microsecond=0
-                    )
-                    
-                    # Check if slot is available
-                    if self._is_slot_available(slot_start, slot_end):
-                        available_slots.append({
-                            'date': check_date.date(),
-                            'day': day_name,
-                            'time': time_range,
-                            'start': slot_start,
-                            'end': slot_end,
-                            'formatted': f"{day_name} {check_date.strftime('%B %d')} at {start_hour[0]}:{start_hour[1]:02d}"
-                        })
-                        
         logger.info(f"Found {len(available_slots)} available slots")
+        self._store_cached(cache_key, available_slots)
         return available_slots
         
     def _parse_time_range(self, time_range: str) -> Tuple[Tuple[int, int], Tuple[int, int]]:
@@ -118,54 +313,152 @@ class CalendarManager:
         end_hour, end_min = map(int, end_str.split(':'))
         return ((start_hour, start_min), (end_hour, end_min))
         
-    def _is_slot_available(self, start: datetime, end: datetime) -> bool:
-        """Check if a time slot is available in calendar"""
-        if not self.calendar:
-            # If no calendar connection, assume available
-            return True
-            
+    def _supports_freebusy(self) -> bool:
+        """Probe once whether the server answers free-busy queries for this calendar"""
         try:
-            # Search for events in this time range
-            events = self.calendar.date_search(start, end)
+            now = datetime.now(self.timezone)
+            self._fetch_freebusy_periods(now, now + timedelta(hours=1))
+            return True
+        except Exception as e:
+            logger.debug(f"Free-busy queries unsupported, falling back to event search: {e}")
+            return False
             
-            # If no events found, slot is available
-            return len(events) == 0
+    def _fetch_freebusy_periods(self, start: datetime, end: datetime, calendar=None) -> List[Tuple[datetime, datetime]]:
+        """Busy periods in a range from a server-computed free-busy report"""
+        from icalendar import Calendar
+        
+        freebusy = (calendar or self.calendar).freebusy_request(start, end)
+        periods = []
+        for component in Calendar.from_ical(freebusy.data).walk('VFREEBUSY'):
+            values = component.get('FREEBUSY', [])
+            if not isinstance(values, list):
+                values = [values]
+            for value in values:
+                period_start, period_end = value.dt
+                if isinstance(period_end, timedelta):
+                    period_end = period_start + period_end
+                periods.append((period_start, period_end))
+        return periods
+        
+    def _event_periods(self, event) -> List[Tuple[datetime, datetime]]:
+        """Start/end of every VEVENT in a fetched calendar object"""
+        from icalendar import Calendar
+        
+        periods = []
+        for component in Calendar.from_ical(event.data).walk('VEVENT'):
+            event_start = self._as_datetime(component.decoded('DTSTART'))
+            if 'DTEND' in component:
+                event_end = self._as_datetime(component.decoded('DTEND'))
+            elif 'DURATION' in component:
+                event_end = event_start + component.decoded('DURATION')
+            elif not isinstance(component.decoded('DTSTART'), datetime):
+                event_end = event_start + timedelta(days=1)  # All-day event
+            else:
+                event_end = event_start
+            periods.append((event_start, event_end))
+        return periods
+        
+    def _as_datetime(self, value) -> datetime:
+        """Timezone-aware datetime for an iCalendar DATE or DATE-TIME value"""
+        if not isinstance(value, datetime):
+            return self.timezone.localize(datetime(value.year, value.month, value.day))
+        if value.tzinfo is None:
+            return self.timezone.localize(value)
+        return value
+        
+    def _fetch_calendar_periods(self, calendar, start: datetime, end: datetime) -> List[Tuple[datetime, datetime]]:
+        """Busy periods in a range for one calendar
+        
+        Prefers a free-busy report, then an event search with recurrences expanded
+        server-side
+        """
+        if self._use_freebusy:
+            try:
+                return self._fetch_freebusy_periods(start, end, calendar)
+            except Exception as e:
+                logger.warning(f"Free-busy query failed, falling back to event search: {e}")
+                self._use_freebusy = False
+        return [period for event in calendar.date_search(start, end, expand=True)
+                for period in self._event_periods(event)]
+        
+    def _fetch_busy_intervals(self, start: datetime, end: datetime) -> Optional[List[Tuple[float, float]]]:
+        """Merged, sorted busy intervals as epoch seconds over a range, or None if unknown
+        
+        One free-busy report (or one event search as fallback) per calendar covers the
+        whole range; multiple calendars are queried in parallel
+        """
+        if not self.calendar:
+            return None
             
+        calendars = self.calendars or [self.calendar]
+        try:
+            if len(calendars) == 1:
+                periods = self._fetch_calendar_periods(calendars[0], start, end)
+            else:
+                with ThreadPoolExecutor(max_workers=len(calendars)) as executor:
+                    futures = [executor.submit(self._fetch_calendar_periods, calendar, start, end)
+                               for calendar in calendars]
+                    periods = [period for future in as_completed(futures) for period in future.result()]
         except Exception as e:
+            from caldav.lib.error import NotFoundError
+            if isinstance(e, NotFoundError):
+                # A cached calendar URL no longer exists; rediscover on next start
+                self._invalidate_calendar_list_cache()
             logger.error(f"Failed to check availability: {e}")
-            # On error, assume available
-            return True
+            return None
             
-    def create_date_event(self, date_details: Dict) -> bool:
-        """Create a calendar event for a date"""
+        merged: List[Tuple[float, float]] = []
+        for busy_start, busy_end in sorted((s.timestamp(), e.timestamp()) for s, e in periods):
+            if merged and busy_start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], busy_end))
+            else:
+                merged.append((busy_start, busy_end))
+        return merged
+        
+    @staticmethod
+    def _overlaps_busy(busy: Optional[List[Tuple[float, float]]], starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Mask of slots (epoch seconds) overlapping any merged busy interval; unknown availability counts as free"""
+        if not busy:
+            return np.zeros(starts.shape, dtype=bool)
+        busy_arr = np.asarray(busy, dtype=np.float64)
+        # Intervals are disjoint and sorted, so only the last one starting before a slot ends can overlap
+        index = np.searchsorted(busy_arr[:, 0], ends, side='left')
+        prev_end = busy_arr[np.maximum(index - 1, 0), 1]
+        return (index > 0) & (prev_end > starts)
+        
+    def create_date_event(self, date_details: Dict, strict: bool = False) -> bool:
+        """Create a calendar event for a date
+        
+        The iCalendar text is formatted from a fixed template; strict builds it
+        through icalendar's validating API instead
+        """
         try:
             if not self.calendar:
                 logger.warning("No calendar connection, skipping event creation")
                 return False
                 
-            # Create event
-            cal = Calendar()
-            event = Event()
-            
-            # Set event properties
-            event.add('summary', f"Date with {date_details['name']}")
-            event.add('dtstart', date_details['start'])
-            event.add('dtend', date_details['end'])
-            event.add('location', date_details.get('location', 'TBD'))
-            
             # Add description
             description = f"""Date with {date_details['name']}
 Activity: {date_details.get('activity', 'Coffee/Drinks')}
 Notes: {date_details.get('notes', 'Met on Tinder')}
 Phone: {date_details.get('phone', 'Not provided yet')}"""
-            event.add('description', description)
-            
-            # Add reminder (30 minutes before)
-            event.add('alarm', timedelta(minutes=-30))
             
+            if strict:
+                ics = self._build_event_ical(date_details, description)
+            else:
+                ics = _ICS_TEMPLATE.format(
+                    uid=uuid.uuid4(),
+                    stamp=datetime.now(pytz.utc).strftime('%Y%m%dT%H%M%SZ'),
+                    start=_ics_datetime(date_details['start'], self.timezone),
+                    end=_ics_datetime(date_details['end'], self.timezone),
+                    summary=_ics_text_line('SUMMARY', f"Date with {date_details['name']}"),
+                    location=_ics_text_line('LOCATION', date_details.get('location', 'TBD')),
+                    description=_ics_text_line('DESCRIPTION', description)
+                )
+                
             # Add event to calendar
-            cal.add_component(event)
-            self.calendar.add_event(cal.to_ical())
+            self.calendar.add_event(ics)
+            self.invalidate_cache()
             
             logger.success(f"Created calendar event for date with {date_details['name']}")
             return True
@@ -174,6 +467,35 @@ Phone: {date_details.get('phone', 'Not provided yet')}"""
             logger.error(f"Failed to create calendar event: {e}")
             return False
             
+    def _build_event_ical(self, date_details: Dict, description: str) -> bytes:
+        """Date event built and validated through icalendar"""
+        from icalendar import Alarm, Calendar, Event
+        
+        # Create event
+        cal = Calendar()
+        cal.add('prodid', '-//DatingWizard//EN')
+        cal.add('version', '2.0')
+        event = Event()
+        
+        # Set event properties
+        event.add('uid', str(uuid.uuid4()))
+        event.add('dtstamp', datetime.now(pytz.utc))
+        event.add('summary', f"Date with {date_details['name']}")
+        event.add('dtstart', date_details['start'])
+        event.add('dtend', date_details['end'])
+        event.add('location', date_details.get('location', 'TBD'))
+        event.add('description', description)
+        
+        # Add reminder (30 minutes before)
+        alarm = Alarm()
+        alarm.add('action', 'DISPLAY')
+        alarm.add('description', 'Reminder')
+        alarm.add('trigger', timedelta(minutes=-30))
+        event.add_component(alarm)
+        
+        cal.add_component(event)
+        return cal.to_ical()
+        
     def suggest_date_times(self, match_name: str) -> List[str]:
         """Get formatted date time suggestions for a match"""
         available_slots = self.get_availability()
@@ -249,26 +571,55 @@ Phone: {date_details.get('phone', 'Not provided yet')}"""
         
         return location_map.get(activity, "Location TBD")
         
+    def _search_date_events(self, start: datetime, end: datetime, summary: str) -> List:
+        """Find events whose summary contains the given text
+        
+        Uses a CalDAV text-match on SUMMARY so the server does the filtering;
+        falls back to downloading the range and filtering locally
+        """
+        try:
+            return self.calendar.search(start=start, end=end, summary=summary,
+                                        event=True, expand=False)
+        except Exception as e:
+            logger.debug(f"Server-side summary search unavailable, filtering locally: {e}")
+            needle = summary.lower()
+            return [event for event in self.calendar.date_search(start, end)
+                    if needle in event.data.lower()]
+            
     def update_event_with_phone(self, match_name: str, phone_number: str) -> bool:
         """Update existing date event with phone number"""
         try:
             if not self.calendar:
                 return False
                 
+            from icalendar import Calendar
+                
             # Search for event
             today = datetime.now(self.timezone)
             week_later = today + timedelta(days=7)
             
-            events = self.calendar.date_search(today, week_later)
+            events = self._search_date_events(today, week_later, f"Date with {match_name}")
             
             for event in events:
-                event_data = event.data
-                if match_name.lower() in event_data.lower():
-                    # Update description with phone number
-                    # This would require parsing and updating the iCal data
-                    logger.info(f"Updated event with phone number for {match_name}")
-                    return True
+                vcal = Calendar.from_ical(event.data)
+                vevent = next(iter(vcal.walk('VEVENT')), None)
+                if vevent is None:
+                    continue
                     
+                # Update description with phone number, replacing the placeholder line
+                lines = [line for line in str(vevent.get('description', '')).splitlines()
+                         if not line.startswith('Phone:')]
+                lines.append(f"Phone: {phone_number}")
+                vevent.pop('description', None)
+                vevent.add('description', '\n'.join(lines))
+                
+                event.data = vcal.to_ical()
+                event.save()
+                self.invalidate_cache()
+                
+                logger.info(f"Updated event with phone number for {match_name}")
+                return True
+                
             return False
             
         except Exception as e:
@@ -286,18 +637,22 @@ Phone: {date_details.get('phone', 'Not provided yet')}"""
             today = datetime.now(self.timezone)
             week_later = today + timedelta(days=7)
             
-            events = self.calendar.date_search(today, week_later)
+            cache_key = ('upcoming', today.date())
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                return cached
+            
+            events = self._search_date_events(today, week_later, "Date with")
             
             for event in events:
-                event_data = event.data
                 # Parse event data to extract date information
                 # This would require iCal parsing
-                if "Date with" in event_data:
-                    upcoming.append({
-                        'raw': event_data
-                    })
+                upcoming.append({
+                    'raw': event.data
+                })
                     
             logger.info(f"Found {len(upcoming)} upcoming dates")
+            self._store_cached(cache_key, upcoming)
             return upcoming
             
         except Exception as e:
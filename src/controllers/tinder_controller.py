@@ -3,30 +3,178 @@ Tinder Web Controller using Selenium
 Handles all interactions with Tinder's web interface
 """
 
+import base64
+import re
 import time
 import random
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.chrome.service import Service
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException, SessionNotCreatedException
 from loguru import logger
 
 
+@lru_cache(maxsize=1)
+def _install_chromedriver() -> str:
+    """Resolve (downloading if needed) the chromedriver binary once per process"""
+    # webdriver_manager pulls in its own HTTP stack, so only load it when a driver must be resolved
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+_BACKGROUND_URL = re.compile(r'url\("([^"]+)"\)')
+
+# Locators, built once instead of on every swipe/extract call; the XPath text
+# locators are only fallbacks for _find_by_text
+_LOGIN_BUTTON = (By.XPATH, "//button[contains(text(), 'Log in')]")
+_LOGIN_LINK = (By.XPATH, "//a[contains(text(), 'Log in')]")
+_PROFILE_CARD = (By.CSS_SELECTOR, '[class*="recsCard"]')
+_LIKE = (By.CSS_SELECTOR, '[aria-label="Like"]')
+_NOPE = (By.CSS_SELECTOR, '[aria-label="Nope"]')
+_SUPER = (By.CSS_SELECTOR, '[aria-label="Super Like"]')
+_KEEP_SWIPING = (By.XPATH, "//button[contains(text(), 'Keep Swiping')]")
+_MATCHES_LINK = (By.CSS_SELECTOR, '[href="/app/matches"]')
+_MATCH_ITEM = (By.CSS_SELECTOR, '[class*="matchListItem"]')
+_MATCH_NAME = (By.CSS_SELECTOR, '[class*="Ell"]')
+_MATCH_AVATAR = (By.CSS_SELECTOR, '[role="img"]')
+_MESSAGE_INPUT = (By.CSS_SELECTOR, '[placeholder*="Type a message"]')
+_SEND_BUTTON = (By.CSS_SELECTOR, '[type="submit"]')
+_CHAT_MESSAGE = (By.CSS_SELECTOR, '[class*="Message"]')
+
+# Wait predicates are stateless, so they can be shared across calls
+_PROFILE_CARD_PRESENT = EC.presence_of_element_located(_PROFILE_CARD)
+_LIKE_CLICKABLE = EC.element_to_be_clickable(_LIKE)
+_NOPE_CLICKABLE = EC.element_to_be_clickable(_NOPE)
+_SUPER_CLICKABLE = EC.element_to_be_clickable(_SUPER)
+_MESSAGE_INPUT_PRESENT = EC.presence_of_element_located(_MESSAGE_INPUT)
+
+# Click the bio "expand" control if present; returns whether it was clicked
+_EXPAND_BIO_JS = """
+const btn = document.querySelector('[class*="ExpandText"]');
+if (btn) { btn.click(); return true; }
+return false;
+"""
+
+# Watch for the match dialog with a MutationObserver (installed once per page) and
+# return-and-reset the flag, instead of an XPath text scan of the whole tree per swipe
+_CHECK_MATCH_JS = """
+if (!window.__matchObserver) {
+    window.__matched = document.body.innerText.includes("It's a Match");
+    window.__matchObserver = new MutationObserver((mutations) => {
+        for (const m of mutations)
+            for (const n of m.addedNodes)
+                if (n.textContent && n.textContent.includes("It's a Match")) window.__matched = true;
+    });
+    window.__matchObserver.observe(document.body, {childList: true, subtree: true});
+}
+const matched = window.__matched;
+window.__matched = false;
+return matched;
+"""
+
+# First element matching a CSS selector whose text contains a string (CSS can't match on text)
+_FIND_BY_TEXT_JS = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .find(el => el.textContent.includes(arguments[1])) || null;
+"""
+
+# Read every profile field in one browser round-trip
+_EXTRACT_PROFILE_JS = """
+const text = (el) => el ? el.innerText : null;
+const distance = document.evaluate("//*[contains(text(), 'miles away')]", document, null,
+                                   XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+return {
+    name: text(document.querySelector('[itemprop="name"]')),
+    bio: text(document.querySelector('[class*="BreakWord"]')),
+    distance: text(distance),
+    imageStyles: Array.from(document.querySelectorAll('[class*="media"] [role="img"]'),
+                            el => el.getAttribute('style') || ''),
+    interests: Array.from(document.querySelectorAll('[class*="Pill"]'), el => el.innerText)
+};
+"""
+
+
 class TinderController:
     """Controls Tinder Web interactions via Selenium"""
     
-    def __init__(self, headless: bool = False):
+    # Resolved chromedriver binary, reused across runs to skip the version check
+    DRIVER_PATH_CACHE = Path("cache/chromedriver_path")
+    CHROME_PROFILE_DIR = Path("data/chrome_profile")
+    MATCHES_CACHE_TTL_SECONDS = 30
+    SCREENSHOT_DIR = Path("data/screenshots")
+    SCREENSHOT_JPEG_QUALITY = 85
+    
+    def __init__(self, headless: bool = False, attach_port: Optional[int] = None):
         self.driver = None
         self.headless = headless
+        self.attach_port = attach_port
+        self.attached = False
         self.wait = None
+        # Whether the current service uses the chromedriver path cached by an earlier run
+        self._driver_from_cache = False
+        # Match name (lowercased) -> list element, refreshed by get_matches
+        self._matches_cache: Optional[Dict] = None
+        self._matches_cache_ts = 0.0
+        self.SCREENSHOT_DIR.mkdir(parents=True, exist_ok=True)
         self._setup_driver()
         
+    def _driver_service(self) -> Service:
+        """Chromedriver service, reusing a previously installed binary when present"""
+        try:
+            cached = Path(self.DRIVER_PATH_CACHE.read_text().strip())
+            if cached.is_file():
+                self._driver_from_cache = True
+                return Service(str(cached))
+        except OSError:
+            pass
+            
+        self._driver_from_cache = False
+        driver_path = _install_chromedriver()
+        try:
+            self.DRIVER_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            self.DRIVER_PATH_CACHE.write_text(driver_path)
+        except OSError as e:
+            logger.debug(f"Could not cache chromedriver path: {e}")
+        return Service(driver_path)
+        
+    def _forget_driver_path(self):
+        """Drop the cached chromedriver path so the next service resolves a fresh binary"""
+        _install_chromedriver.cache_clear()
+        try:
+            self.DRIVER_PATH_CACHE.unlink()
+        except OSError:
+            pass
+            
+    def _attach_driver(self, service: Service) -> bool:
+        """Attach to an already running Chrome on the remote debugging port"""
+        options = webdriver.ChromeOptions()
+        options.add_experimental_option("debuggerAddress", f"127.0.0.1:{self.attach_port}")
+        try:
+            self.driver = webdriver.Chrome(service=service, options=options)
+        except Exception as e:
+            logger.info(f"No Chrome listening on port {self.attach_port}, launching a new one: {e}")
+            return False
+        self.attached = True
+        logger.info(f"Attached to running Chrome on port {self.attach_port}")
+        return True
+        
     def _setup_driver(self):
-        """Initialize Chrome driver with optimal settings"""
+        """Initialize Chrome driver with optimal settings
+        
+        With attach_port set, an existing browser (and its logged-in session) is
+        reused; otherwise the launched browser listens on that port for next time
+        """
+        service = self._driver_service()
+        if self.attach_port and self._attach_driver(service):
+            self.wait = WebDriverWait(self.driver, 10)
+            return
+            
         options = webdriver.ChromeOptions()
         
         # Essential options for stealth
@@ -47,6 +195,8 @@ class TinderController:
         
         if self.headless:
             options.add_argument('--headless')
+            # Never fetch or decode photos; URLs still come from background-image styles
+            options.add_argument('--blink-settings=imagesEnabled=false')
         else:
             # Make window look normal
             options.add_argument('--start-maximized')
@@ -58,21 +208,50 @@ class TinderController:
         prefs = {
             "profile.default_content_setting_values.notifications": 2,
             "profile.default_content_settings.popups": 0,
-            "profile.managed_default_content_settings.images": 2
+            "profile.managed_default_content_settings.images": 2,
+            # Stylesheets must stay on: image URLs are read from inline background-image styles
+            "profile.managed_default_content_settings.stylesheets": 1
         }
         options.add_experimental_option("prefs", prefs)
         
-        # For newer selenium versions
-        from selenium.webdriver.chrome.service import Service
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=options)
+        if self.attach_port:
+            # Persistent profile keeps cookies, and the browser outlives this process for reattaching
+            options.add_argument(f"--remote-debugging-port={self.attach_port}")
+            options.add_argument(f"--user-data-dir={self.CHROME_PROFILE_DIR.resolve()}")
+            options.add_experimental_option("detach", True)
+            
+        try:
+            self.driver = webdriver.Chrome(service=service, options=options)
+        except SessionNotCreatedException as e:
+            if not self._driver_from_cache:
+                raise
+            # Chrome auto-updated past the cached chromedriver; reinstall once and retry
+            logger.warning(f"Cached chromedriver was rejected, reinstalling: {e}")
+            self._forget_driver_path()
+            self.driver = webdriver.Chrome(service=self._driver_service(), options=options)
         self.wait = WebDriverWait(self.driver, 10)
         
         # Execute script to remove webdriver property
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
+    def _find_by_text(self, selector: str, text: str, fallback: Tuple[str, str]):
+        """First element matching a CSS selector whose text contains the string, or None
+        
+        Scans the selector's matches in the page instead of evaluating a text() XPath;
+        the XPath locator is only used if the script fails
+        """
+        try:
+            return self.driver.execute_script(_FIND_BY_TEXT_JS, selector, text)
+        except Exception:
+            elements = self.driver.find_elements(*fallback)
+            return elements[0] if elements else None
+            
     def login(self, email: str = None, password: str = None, use_phone: bool = False):
         """Login to Tinder Web"""
+        if self.attached and '/app/' in self.driver.current_url:
+            logger.info("Reusing logged-in browser session")
+            return True
+            
         logger.info("Navigating to Tinder...")
         self.driver.get("https://tinder.com")
         
@@ -85,13 +264,13 @@ class TinderController:
             # Try to find and click login button
             try:
                 login_btn = wait_long.until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Log in')]"))
+                    lambda driver: self._find_by_text('button', 'Log in', _LOGIN_BUTTON)
                 )
                 login_btn.click()
             except:
                 # Alternative: look for "Sign in" or other variations
                 try:
-                    login_btn = self.driver.find_element(By.XPATH, "//a[contains(text(), 'Log in')]")
+                    login_btn = self._find_by_text('a', 'Log in', _LOGIN_LINK)
                     login_btn.click()
                 except:
                     logger.info("Could not find login button automatically")
@@ -123,60 +302,38 @@ class TinderController:
         
         try:
             # Wait for profile card to be present
-            self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="recsCard"]'))
-            )
+            self.wait.until(_PROFILE_CARD_PRESENT)
             
-            # Extract name and age
+            # Click to expand bio if needed
             try:
-                name_age = self.driver.find_element(By.CSS_SELECTOR, '[itemprop="name"]').text
-                if name_age:
-                    parts = name_age.rsplit(' ', 1)
-                    profile_data['name'] = parts[0] if parts else name_age
-                    profile_data['age'] = parts[1] if len(parts) > 1 else None
-            except NoSuchElementException:
-                pass
-                
-            # Extract bio
-            try:
-                # Click to expand bio if needed
-                expand_btn = self.driver.find_element(By.CSS_SELECTOR, '[class*="ExpandText"]')
-                if expand_btn:
-                    expand_btn.click()
+                if self.driver.execute_script(_EXPAND_BIO_JS):
                     time.sleep(0.5)
             except:
                 pass
                 
+            # Extract all fields in a single script call instead of one round-trip per field
             try:
-                bio_element = self.driver.find_element(By.CSS_SELECTOR, '[class*="BreakWord"]')
-                profile_data['bio'] = bio_element.text
-            except NoSuchElementException:
-                pass
-                
-            # Extract distance
-            try:
-                distance_element = self.driver.find_element(By.XPATH, "//*[contains(text(), 'miles away')]")
-                profile_data['distance'] = distance_element.text
-            except NoSuchElementException:
-                pass
-                
-            # Extract images
-            try:
-                image_elements = self.driver.find_elements(By.CSS_SELECTOR, '[class*="media"] [role="img"]')
-                for img in image_elements:
-                    style = img.get_attribute('style')
-                    if 'background-image' in style:
-                        url = style.split('url("')[1].split('")')[0]
-                        profile_data['images'].append(url)
-            except:
-                pass
+                data = self.driver.execute_script(_EXTRACT_PROFILE_JS) or {}
+            except Exception as e:
+                logger.debug(f"Profile extraction script failed: {e}")
+                data = {}
+            
+            name_age = data.get('name')
+            if name_age:
+                parts = name_age.rsplit(' ', 1)
+                profile_data['name'] = parts[0] if parts else name_age
+                profile_data['age'] = parts[1] if len(parts) > 1 else None
                 
-            # Extract interests/passions
-            try:
-                interest_elements = self.driver.find_elements(By.CSS_SELECTOR, '[class*="Pill"]')
-                profile_data['interests'] = [elem.text for elem in interest_elements if elem.text]
-            except:
-                pass
+            profile_data['bio'] = data.get('bio')
+            profile_data['distance'] = data.get('distance')
+            
+            for style in data.get('imageStyles') or []:
+                if 'background-image' in style:
+                    match = _BACKGROUND_URL.search(style)
+                    if match:
+                        profile_data['images'].append(match.group(1))
+                        
+            profile_data['interests'] = [text for text in data.get('interests') or [] if text]
                 
             logger.debug(f"Extracted profile: {profile_data['name']}, {profile_data['age']}")
             return profile_data
@@ -189,9 +346,7 @@ class TinderController:
         """Perform right swipe (like)"""
         try:
             # Method 1: Click Like button
-            like_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[aria-label="Like"]'))
-            )
+            like_button = self.wait.until(_LIKE_CLICKABLE)
             like_button.click()
             logger.info("Swiped right ✓")
             return True
@@ -210,9 +365,7 @@ class TinderController:
         """Perform left swipe (pass)"""
         try:
             # Method 1: Click Nope button
-            nope_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[aria-label="Nope"]'))
-            )
+            nope_button = self.wait.until(_NOPE_CLICKABLE)
             nope_button.click()
             logger.info("Swiped left ✗")
             return True
@@ -230,9 +383,7 @@ class TinderController:
     def super_like(self) -> bool:
         """Perform super like"""
         try:
-            super_like_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[aria-label="Super Like"]'))
-            )
+            super_like_button = self.wait.until(_SUPER_CLICKABLE)
             super_like_button.click()
             logger.info("Super liked! ⭐")
             return True
@@ -244,18 +395,18 @@ class TinderController:
         """Check if a match occurred after swiping"""
         try:
             # Look for match popup
-            match_popup = self.driver.find_element(By.XPATH, "//*[contains(text(), 'It\'s a Match')]")
-            if match_popup:
+            if self.driver.execute_script(_CHECK_MATCH_JS):
                 logger.success("It's a match! 🎉")
                 return True
-        except NoSuchElementException:
+            return False
+        except Exception:
             return False
             
     def close_match_popup(self):
         """Close the match popup to continue swiping"""
         try:
             # Try to find and click "Keep Swiping" button
-            keep_swiping = self.driver.find_element(By.XPATH, "//button[contains(text(), 'Keep Swiping')]")
+            keep_swiping = self._find_by_text('button', 'Keep Swiping', _KEEP_SWIPING)
             keep_swiping.click()
         except:
             try:
@@ -270,19 +421,20 @@ class TinderController:
         matches = []
         try:
             # Navigate to matches
-            matches_button = self.driver.find_element(By.CSS_SELECTOR, '[href="/app/matches"]')
+            matches_button = self.driver.find_element(*_MATCHES_LINK)
             matches_button.click()
             time.sleep(2)
             
             # Get all match cards
-            match_elements = self.driver.find_elements(By.CSS_SELECTOR, '[class*="matchListItem"]')
+            match_elements = self.driver.find_elements(*_MATCH_ITEM)
             
             for match in match_elements:
                 try:
-                    name = match.find_element(By.CSS_SELECTOR, '[class*="Ell"]').text
-                    avatar = match.find_element(By.CSS_SELECTOR, '[role="img"]')
+                    name = match.find_element(*_MATCH_NAME).text
+                    avatar = match.find_element(*_MATCH_AVATAR)
                     style = avatar.get_attribute('style')
-                    image_url = style.split('url("')[1].split('")')[0] if 'url' in style else None
+                    url_match = _BACKGROUND_URL.search(style or '')
+                    image_url = url_match.group(1) if url_match else None
                     
                     matches.append({
                         'name': name,
@@ -292,6 +444,9 @@ class TinderController:
                 except:
                     continue
                     
+            self._matches_cache = {match['name'].lower(): match['element'] for match in matches}
+            self._matches_cache_ts = time.monotonic()
+            
             logger.info(f"Found {len(matches)} matches")
             return matches
             
@@ -300,36 +455,61 @@ class TinderController:
             return matches
             
     def open_chat(self, match_name: str) -> bool:
-        """Open chat with a specific match"""
+        """Open chat with a specific match
+        
+        Reuses the element map from a recent get_matches call instead of
+        re-scraping the match list
+        """
         try:
-            matches = self.get_matches()
-            for match in matches:
-                if match['name'].lower() == match_name.lower():
-                    match['element'].click()
-                    time.sleep(1)
-                    logger.info(f"Opened chat with {match_name}")
-                    return True
+            fresh = (self._matches_cache is not None
+                     and time.monotonic() - self._matches_cache_ts < self.MATCHES_CACHE_TTL_SECONDS)
+            if not fresh:
+                self.get_matches()
+                
+            element = self._matches_cache.get(match_name.lower()) if self._matches_cache else None
+            if element is not None:
+                try:
+                    element.click()
+                except StaleElementReferenceException:
+                    # The list re-rendered since it was cached; scrape it again once
+                    self.get_matches()
+                    element = self._matches_cache.get(match_name.lower())
+                    if element is None:
+                        logger.warning(f"Match {match_name} not found")
+                        return False
+                    element.click()
+                time.sleep(1)
+                logger.info(f"Opened chat with {match_name}")
+                return True
             logger.warning(f"Match {match_name} not found")
             return False
         except Exception as e:
             logger.error(f"Failed to open chat: {e}")
             return False
             
-    def send_message(self, message: str) -> bool:
-        """Send a message in the current chat"""
+    def send_message(self, message: str, human_typing: bool = False) -> bool:
+        """Send a message in the current chat
+        
+        By default the text is inserted in one CDP call; human_typing sends it
+        keystroke by keystroke instead
+        """
         try:
             # Find message input field
-            message_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[placeholder*="Type a message"]'))
-            )
-            
-            # Type message with human-like delays
-            for char in message:
-                message_input.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+            message_input = self.wait.until(_MESSAGE_INPUT_PRESENT)
+            
+            if human_typing:
+                # Type message with human-like delays
+                for char in message:
+                    message_input.send_keys(char)
+                    time.sleep(random.uniform(0.05, 0.15))
+            else:
+                # Insert the whole message at once, keeping the same overall typing time
+                message_input.click()
+                self.driver.execute_cdp_cmd("Input.insertText", {"text": message})
+                time.sleep(sum(random.uniform(0.05, 0.15) for _ in message))
                 
             # Send message
-            send_button = self.driver.find_element(By.CSS_SELECTOR, '[type="submit"]')
+            send_button = self.driver.find_element(*_SEND_BUTTON)
             send_button.click()
             
             logger.info(f"Sent message: {message[:50]}...")
@@ -343,7 +523,7 @@ class TinderController:
         """Get all messages from current chat"""
         messages = []
         try:
-            message_elements = self.driver.find_elements(By.CSS_SELECTOR, '[class*="Message"]')
+            message_elements = self.driver.find_elements(*_CHAT_MESSAGE)
             
             for msg_elem in message_elements:
                 try:
@@ -366,12 +546,25 @@ class TinderController:
             logger.error(f"Failed to get messages: {e}")
             return messages
             
-    def take_screenshot(self, filename: str = None) -> str:
-        """Take screenshot of current page"""
+    def take_screenshot(self, filename: str = None, as_bytes: bool = False) -> Union[str, bytes]:
+        """Take screenshot of current page
+        
+        Captured as JPEG straight from Chrome, skipping the PNG encode; with
+        as_bytes the encoded image is returned instead of written to disk
+        """
+        result = self.driver.execute_cdp_cmd(
+            'Page.captureScreenshot',
+            {'format': 'jpeg', 'quality': self.SCREENSHOT_JPEG_QUALITY}
+        )
+        data = base64.b64decode(result['data'])
+        if as_bytes:
+            return data
+            
         if not filename:
-            filename = f"screenshot_{int(time.time())}.png"
-        filepath = f"data/screenshots/{filename}"
-        self.driver.save_screenshot(filepath)
+            filename = f"screenshot_{int(time.time())}.jpg"
+        filepath = str((self.SCREENSHOT_DIR / filename).with_suffix('.jpg'))
+        with open(filepath, 'wb') as f:
+            f.write(data)
         logger.debug(f"Screenshot saved: {filepath}")
         return filepath
         
@@ -382,6 +575,12 @@ class TinderController:
         
     def close(self):
         """Close the browser and cleanup"""
-        if self.driver:
+        if not self.driver:
+            return
+        if self.attach_port:
+            # Leave the browser running so the next controller can reattach
+            self.driver.service.stop()
+            logger.info("Detached from browser")
+        else:
             self.driver.quit()
             logger.info("Browser closed")
\ No newline at end of file
@@ -5,13 +5,32 @@ Handles openers, responses, and goal-oriented conversations
 
 import os
 import json
+import asyncio
+import re
 from typing import Dict, List, Optional
 from enum import Enum
+from types import MappingProxyType
+import ahocorasick
 import openai
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from loguru import logger
 import random
 
+from .response_cache import ResponseCache
+from .semantic_cache import SemanticCache
+
+
+COACH_INSTRUCTIONS = "You are a dating coach helping craft engaging, authentic messages."
+
+# Any of these in a user message means we already asked to move off the app (substring match)
+NUMBER_REQUEST_PATTERN = re.compile(r'number|text|phone|whatsapp', re.IGNORECASE)
+
+FALLBACK_MESSAGES = (
+    "Hey! Your profile really caught my attention. How's your day going?",
+    "Hi there! I'd love to know more about you. What's been the highlight of your week?",
+    "Hey! You seem really interesting. What are you up to today?"
+)
+
 
 class ConversationStage(Enum):
     OPENER = "opener"
@@ -22,14 +41,87 @@ class ConversationStage(Enum):
     SCHEDULE_DATE = "schedule_date"
 
 
+# Lookup tables shared by every generator instead of being rebuilt per call
+STYLE_MAP = MappingProxyType({
+    "casual_witty": "Be casual, friendly, and occasionally witty without trying too hard",
+    "formal": "Be polite, respectful, and somewhat formal",
+    "funny": "Be humorous and playful while staying respectful",
+    "flirty": "Be subtly flirty and charming without being inappropriate",
+    "intellectual": "Be thoughtful and show intellectual curiosity"
+})
+
+GOAL_MAP = MappingProxyType({
+    ConversationStage.BUILD_RAPPORT: "Build rapport and find common ground",
+    ConversationStage.DEEPEN_CONNECTION: "Deepen the connection and show genuine interest",
+    ConversationStage.SUGGEST_MOVE_OFF_APP: "Naturally suggest moving the conversation off the app",
+    ConversationStage.GET_NUMBER: "Smoothly ask for their phone number",
+    ConversationStage.SCHEDULE_DATE: "Suggest a specific date idea based on shared interests"
+})
+
+ACTIVITY_MAP = MappingProxyType({
+    "coffee": "coffee at that new place downtown",
+    "fitness": "a hike followed by smoothies",
+    "wine": "wine tasting at that cozy bar",
+    "art": "checking out the new gallery exhibition",
+    "music": "live music at the jazz club",
+    "foodie": "trying that new restaurant everyone's talking about"
+})
+
+TEMPLATES = {
+    "openers": {
+        "question": [
+            "I noticed you're into {interest}, what got you started with that?",
+            "Your photo at {location} looks amazing! How was that experience?",
+            "{bio_reference}... I'm curious, what's the story behind that?"
+        ],
+        "compliment": [
+            "Your {attribute} really caught my eye, and {bio_reference} makes you even more interesting!",
+            "Love that you're into {interest}! What's your favorite thing about it?"
+        ],
+        "humor": [
+            "So {bio_reference}... does that mean you're as {adjective} as you are {attribute}?",
+            "Important question: {interest} enthusiast by day, {other_interest} lover by night?"
+        ]
+    },
+    "number_requests": [
+        "This app is fun but I'd love to continue our conversation over text. What's your number?",
+        "You seem really cool! Want to switch to texting? Here's my number: {user_number}",
+        "I'm terrible at checking this app - mind if we move to text?"
+    ],
+    "date_suggestions": [
+        "Would love to meet you in person! How about {activity} this {day}?",
+        "I know a great {venue_type} that I think you'd love. Free this {day}?",
+        "Since we both love {shared_interest}, want to {related_activity} this weekend?"
+    ]
+}
+
+
 class MessageGenerator:
     """Generates messages for dating app conversations"""
     
+    # Above this temperature generations are meant to vary, so they are never cached
+    CACHE_MAX_TEMPERATURE = 0.3
+    EMBEDDING_MODEL = "text-embedding-3-small"
+    # Concurrent LLM requests when generating for many profiles at once
+    MAX_CONCURRENCY = 8
+    
     def __init__(self, preferences_path: str = "config/preferences.json", llm_provider: str = "openai"):
         self.preferences = self._load_preferences(preferences_path)
         self.llm_provider = llm_provider
+        self.temperature = self.preferences.get('temperature', 0.8)
+        self.response_cache = ResponseCache()
+        self.sem_cache = SemanticCache(dim=1536, threshold=0.92)
         self._setup_llm_client()
         self.conversation_templates = self._load_templates()
+        # Preferences are fixed for the generator's lifetime, so resolve them once
+        self._style_desc = self._get_style_description()
+        self._humor_clause = "- Include a subtle touch of humor" if self.preferences.get('use_humor') else ""
+        self._emoji_clause = ("- Use 1-2 emojis maximum" if self.preferences.get('emoji_usage') == 'moderate'
+                              else "- No emojis" if self.preferences.get('emoji_usage') == 'none' else "")
+        self._interest_automaton = self._compile_interest_automaton()
+        # Invariant instructions go first (as the system prompt) so provider prefix caches can hit
+        self._static_opener_prefix = self._build_opener_instructions()
+        self._static_response_prefix = self._build_response_instructions()
         
     def _load_preferences(self, path: str) -> Dict:
         """Load messaging preferences"""
@@ -45,53 +137,45 @@ class MessageGenerator:
         
     def _setup_llm_client(self):
         """Initialize LLM client based on provider"""
+        self.client = None
+        self.aclient = None
+        self.embedding_client = None
+        if os.getenv("OPENAI_API_KEY"):
+            # Embeddings for the semantic opener cache come from OpenAI whatever the chat provider
+            self.embedding_client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
         if self.llm_provider == "openai":
-            openai.api_key = os.getenv("OPENAI_API_KEY")
             self.model = "gpt-4"
+            try:
+                self.client = openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+                self.aclient = openai.AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+            except openai.OpenAIError as e:
+                # Missing key: generation falls back to canned messages
+                logger.warning(f"OpenAI client unavailable: {e}")
         elif self.llm_provider == "anthropic":
             self.client = Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+            self.aclient = AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
             self.model = "claude-3-opus-20240229"
             
     def _load_templates(self) -> Dict:
         """Load conversation templates"""
-        return {
-            "openers": {
-                "question": [
-                    "I noticed you're into {interest}, what got you started with that?",
-                    "Your photo at {location} looks amazing! How was that experience?",
-                    "{bio_reference}... I'm curious, what's the story behind that?"
-                ],
-                "compliment": [
-                    "Your {attribute} really caught my eye, and {bio_reference} makes you even more interesting!",
-                    "Love that you're into {interest}! What's your favorite thing about it?"
-                ],
-                "humor": [
-                    "So {bio_reference}... does that mean you're as {adjective} as you are {attribute}?",
-                    "Important question: {interest} enthusiast by day, {other_interest} lover by night?"
-                ]
-            },
-            "number_requests": [
-                "This app is fun but I'd love to continue our conversation over text. What's your number?",
-                "You seem really cool! Want to switch to texting? Here's my number: {user_number}",
-                "I'm terrible at checking this app - mind if we move to text?"
-            ],
-            "date_suggestions": [
-                "Would love to meet you in person! How about {activity} this {day}?",
-                "I know a great {venue_type} that I think you'd love. Free this {day}?",
-                "Since we both love {shared_interest}, want to {related_activity} this weekend?"
-            ]
-        }
+        return TEMPLATES
         
     def generate_opener(self, profile_data: Dict) -> str:
         """Generate an opening message based on profile data"""
         logger.info("Generating opener message")
         
-        prompt = self._build_opener_prompt(profile_data)
+        embedding = self._profile_embedding(profile_data)
+        response = self._semantic_cache_lookup(embedding, profile_data)
         
-        if self.llm_provider == "openai":
-            response = self._generate_openai(prompt)
-        else:
-            response = self._generate_anthropic(prompt)
+        if response is None:
+            prompt = self._build_opener_prompt(profile_data)
+            
+            if self.llm_provider == "openai":
+                response = self._generate_openai(prompt, self._static_opener_prefix)
+            else:
+                response = self._generate_anthropic(prompt, self._static_opener_prefix)
+                
+            self._semantic_cache_store(embedding, profile_data, response)
             
         # Post-process to ensure appropriate length and style
         response = self._post_process_message(response, ConversationStage.OPENER)
@@ -99,6 +183,38 @@ class MessageGenerator:
         logger.debug(f"Generated opener: {response}")
         return response
         
+    async def a_generate_opener(self, profile_data: Dict) -> str:
+        """Async version of generate_opener"""
+        embedding = await asyncio.to_thread(self._profile_embedding, profile_data)
+        response = self._semantic_cache_lookup(embedding, profile_data)
+        
+        if response is None:
+            prompt = self._build_opener_prompt(profile_data)
+            
+            if self.llm_provider == "openai":
+                response = await self._a_generate_openai(prompt, self._static_opener_prefix)
+            else:
+                response = await self._a_generate_anthropic(prompt, self._static_opener_prefix)
+                
+            # A periodic save writes the whole index, so keep it off the event loop
+            await asyncio.to_thread(self._semantic_cache_store, embedding, profile_data, response)
+            
+        response = self._post_process_message(response, ConversationStage.OPENER)
+        
+        logger.debug(f"Generated opener: {response}")
+        return response
+        
+    async def generate_openers_batch(self, profiles: List[Dict]) -> List[str]:
+        """Generate openers for many profiles concurrently, in input order"""
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENCY)
+        
+        async def one(profile_data: Dict) -> str:
+            async with semaphore:
+                return await self.a_generate_opener(profile_data)
+                
+        logger.info(f"Generating {len(profiles)} openers (concurrency {self.MAX_CONCURRENCY})")
+        return await asyncio.gather(*(one(profile) for profile in profiles))
+        
     def generate_response(self, conversation_history: List[Dict], their_message: str) -> str:
         """Generate a contextual response"""
         stage = self._determine_conversation_stage(conversation_history)
@@ -107,29 +223,77 @@ class MessageGenerator:
         prompt = self._build_response_prompt(conversation_history, their_message, stage)
         
         if self.llm_provider == "openai":
-            response = self._generate_openai(prompt)
+            response = self._generate_openai(prompt, self._static_response_prefix)
         else:
-            response = self._generate_anthropic(prompt)
+            response = self._generate_anthropic(prompt, self._static_response_prefix)
             
         response = self._post_process_message(response, stage)
         
         logger.debug(f"Generated response: {response}")
         return response
         
-    def _build_opener_prompt(self, profile_data: Dict) -> str:
-        """Build prompt for opener generation"""
-        style_desc = self._get_style_description()
+    async def a_generate_response(self, conversation_history: List[Dict], their_message: str) -> str:
+        """Async version of generate_response"""
+        stage = self._determine_conversation_stage(conversation_history)
+        logger.info(f"Generating response for stage: {stage}")
+        
+        prompt = self._build_response_prompt(conversation_history, their_message, stage)
+        
+        if self.llm_provider == "openai":
+            response = await self._a_generate_openai(prompt, self._static_response_prefix)
+        else:
+            response = await self._a_generate_anthropic(prompt, self._static_response_prefix)
+            
+        response = self._post_process_message(response, stage)
+        
+        logger.debug(f"Generated response: {response}")
+        return response
+        
+    def _profile_embedding(self, profile_data: Dict) -> Optional[List[float]]:
+        """Embedding of a profile's bio and interests, or None when the semantic cache is off
+        
+        The name is left out so near-identical profiles of different people match
+        """
+        if self.embedding_client is None or self.temperature > self.CACHE_MAX_TEMPERATURE:
+            return None
+        bio = (profile_data.get('bio') or '').strip()
+        if not bio:
+            # Empty bios would all look alike
+            return None
+        summary = f"Bio: {bio}\nInterests: {', '.join(profile_data.get('interests', []))}"
+        try:
+            result = self.embedding_client.embeddings.create(model=self.EMBEDDING_MODEL, input=summary)
+            return result.data[0].embedding
+        except Exception as e:
+            logger.warning(f"Profile embedding failed, skipping semantic cache: {e}")
+            return None
+            
+    def _semantic_cache_lookup(self, embedding: Optional[List[float]], profile_data: Dict) -> Optional[str]:
+        """Opener generated for a near-duplicate profile, addressed to this profile's name"""
+        if embedding is None:
+            return None
+        hit = self.sem_cache.search(embedding)
+        if hit is None:
+            return None
+        response = hit['response']
+        if hit.get('name') and profile_data.get('name'):
+            # Whole-word only, so a short name like "Al" leaves words such as "also" intact
+            response = re.sub(rf"\b{re.escape(hit['name'])}\b", lambda _: profile_data['name'], response)
+        return response
         
-        prompt = f"""Generate a dating app opening message with these requirements:
+    def _semantic_cache_store(self, embedding: Optional[List[float]], profile_data: Dict, response: str):
+        """Remember a freshly generated opener (never a fallback) for similar profiles"""
+        if embedding is not None and response not in FALLBACK_MESSAGES:
+            self.sem_cache.add(embedding, response, name=profile_data.get('name'))
+            
+    def _build_opener_instructions(self) -> str:
+        """Build the invariant part of the opener prompt"""
+        return f"""{COACH_INSTRUCTIONS}
 
-Profile Information:
-- Name: {profile_data.get('name', 'Unknown')}
-- Age: {profile_data.get('age', 'Unknown')}
-- Bio: {profile_data.get('bio', 'No bio available')}
-- Interests: {', '.join(profile_data.get('interests', []))}
+Generate a dating app opening message for the profile you are given, with these requirements:
 
 Style Requirements:
-{style_desc}
+{self._style_desc}
 
 Message Requirements:
 - Be {self.preferences.get('style', 'casual and friendly')}
@@ -137,16 +301,43 @@ Message Requirements:
 - Keep it concise (1-2 sentences max)
 - Make it engaging and unique (avoid generic openers)
 - End with a question or conversation starter
-{"- Include a subtle touch of humor" if self.preferences.get('use_humor') else ""}
-{"- Use 1-2 emojis maximum" if self.preferences.get('emoji_usage') == 'moderate' else "- No emojis" if self.preferences.get('emoji_usage') == 'none' else ""}
+{self._humor_clause}
+{self._emoji_clause}
 
 Generate only the message text, nothing else."""
 
+    def _build_response_instructions(self) -> str:
+        """Build the invariant part of the response prompt"""
+        return f"""{COACH_INSTRUCTIONS}
+
+Generate a dating app response message for the conversation you are given, with these requirements:
+
+Style Requirements:
+{self._style_desc}
+
+Message Requirements:
+- Respond naturally to their message
+- Work towards the stated goal
+- Be {self.preferences.get('style', 'casual and friendly')}
+- Keep it concise (1-3 sentences max)
+- Show genuine interest and personality
+{"- Include appropriate humor if it fits" if self.preferences.get('use_humor') else ""}
+{"- Use emojis sparingly" if self.preferences.get('emoji_usage') == 'moderate' else ""}
+
+Generate only the message text, nothing else."""
+
+    def _build_opener_prompt(self, profile_data: Dict) -> str:
+        """Build the per-profile part of the opener prompt"""
+        prompt = f"""Profile Information:
+- Name: {profile_data.get('name', 'Unknown')}
+- Age: {profile_data.get('age', 'Unknown')}
+- Bio: {profile_data.get('bio', 'No bio available')}
+- Interests: {', '.join(profile_data.get('interests', []))}"""
+
         return prompt
         
     def _build_response_prompt(self, conversation_history: List[Dict], their_message: str, stage: ConversationStage) -> str:
-        """Build prompt for response generation"""
-        style_desc = self._get_style_description()
+        """Build the per-conversation part of the response prompt"""
         goal_desc = self._get_goal_description(stage)
         
         # Format conversation history
@@ -155,59 +346,107 @@ Generate only the message text, nothing else."""
             sender = "You" if msg['sender'] == 'user' else "Them"
             history_text += f"{sender}: {msg['text']}\n"
             
-        prompt = f"""Generate a dating app response message with these requirements:
-
-Conversation History:
+        prompt = f"""Conversation History:
 {history_text}
 
 Their Latest Message: {their_message}
 
 Conversation Stage: {stage.value}
-Goal: {goal_desc}
-
-Style Requirements:
-{style_desc}
-
-Message Requirements:
-- Respond naturally to their message
-- {goal_desc}
-- Be {self.preferences.get('style', 'casual and friendly')}
-- Keep it concise (1-3 sentences max)
-- Show genuine interest and personality
-{"- Include appropriate humor if it fits" if self.preferences.get('use_humor') else ""}
-{"- Use emojis sparingly" if self.preferences.get('emoji_usage') == 'moderate' else ""}
-
-Generate only the message text, nothing else."""
+Goal: {goal_desc}"""
 
         return prompt
         
-    def _generate_openai(self, prompt: str) -> str:
+    def _response_cache_key(self, prompt: str, instructions: str) -> Optional[str]:
+        """Cache key for a generation request, or None when it should not be cached"""
+        if self.temperature > self.CACHE_MAX_TEMPERATURE:
+            return None
+        return ResponseCache.make_key(self.llm_provider, self.model, instructions, prompt, self.temperature)
+        
+    def _cached_response(self, cache_key: Optional[str]) -> Optional[str]:
+        """Previously generated text for a cache key, if any"""
+        return self.response_cache.get(cache_key) if cache_key else None
+        
+    def _store_response(self, cache_key: Optional[str], text: str) -> str:
+        """Remember generated text under a cache key and return it"""
+        if cache_key:
+            self.response_cache.set(cache_key, text)
+        return text
+        
+    def _openai_request(self, prompt: str, instructions: str) -> Dict:
+        """Chat completion arguments shared by the sync and async clients"""
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": instructions},
+                {"role": "user", "content": prompt}
+            ],
+            "temperature": self.temperature,
+            "max_tokens": 150
+        }
+        
+    def _anthropic_request(self, prompt: str, instructions: str) -> Dict:
+        """Messages API arguments shared by the sync and async clients"""
+        return {
+            "model": self.model,
+            # Static instructions as a cacheable system block; only the user turn varies
+            "system": [{"type": "text", "text": instructions, "cache_control": {"type": "ephemeral"}}],
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 150,
+            "temperature": self.temperature
+        }
+        
+    def _generate_openai(self, prompt: str, instructions: str = COACH_INSTRUCTIONS) -> str:
         """Generate message using OpenAI"""
+        cache_key = self._response_cache_key(prompt, instructions)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+            
         try:
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are a dating coach helping craft engaging, authentic messages."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8,
-                max_tokens=150
-            )
-            return response.choices[0].message.content.strip()
+            response = self.client.chat.completions.create(**self._openai_request(prompt, instructions))
+            return self._store_response(cache_key, response.choices[0].message.content.strip())
         except Exception as e:
             logger.error(f"OpenAI generation failed: {e}")
             return self._get_fallback_message()
             
-    def _generate_anthropic(self, prompt: str) -> str:
+    async def _a_generate_openai(self, prompt: str, instructions: str = COACH_INSTRUCTIONS) -> str:
+        """Generate message using OpenAI without blocking the event loop"""
+        cache_key = self._response_cache_key(prompt, instructions)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+            
+        try:
+            response = await self.aclient.chat.completions.create(**self._openai_request(prompt, instructions))
+            return self._store_response(cache_key, response.choices[0].message.content.strip())
+        except Exception as e:
+            logger.error(f"OpenAI generation failed: {e}")
+            return self._get_fallback_message()
+            
+    def _generate_anthropic(self, prompt: str, instructions: str = COACH_INSTRUCTIONS) -> str:
         """Generate message using Anthropic Claude"""
+        cache_key = self._response_cache_key(prompt, instructions)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+            
+        try:
+            response = self.client.messages.create(**self._anthropic_request(prompt, instructions))
+            return self._store_response(cache_key, response.content[0].text.strip())
+        except Exception as e:
+            logger.error(f"Anthropic generation failed: {e}")
+            return self._get_fallback_message()
+            
+    async def _a_generate_anthropic(self, prompt: str, instructions: str = COACH_INSTRUCTIONS) -> str:
+        """Generate message using Anthropic Claude without blocking the event loop"""
+        cache_key = self._response_cache_key(prompt, instructions)
+        cached = self._cached_response(cache_key)
+        if cached is not None:
+            return cached
+            
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150,
-                temperature=0.8
-            )
-            return response.content[0].text.strip()
+            response = await self.aclient.messages.create(**self._anthropic_request(prompt, instructions))
+            return self._store_response(cache_key, response.content[0].text.strip())
         except Exception as e:
             logger.error(f"Anthropic generation failed: {e}")
             return self._get_fallback_message()
@@ -224,36 +463,20 @@ Generate only the message text, nothing else."""
             return ConversationStage.DEEPEN_CONNECTION
         elif message_count < 15:
             # Check if we've asked for number yet
-            for msg in conversation_history:
-                if msg['sender'] == 'user' and any(word in msg['text'].lower() 
-                    for word in ['number', 'text', 'phone', 'whatsapp']):
-                    return ConversationStage.SCHEDULE_DATE
+            if any(msg['sender'] == 'user' and NUMBER_REQUEST_PATTERN.search(msg['text'])
+                   for msg in conversation_history):
+                return ConversationStage.SCHEDULE_DATE
             return ConversationStage.SUGGEST_MOVE_OFF_APP
         else:
             return ConversationStage.GET_NUMBER
             
     def _get_style_description(self) -> str:
         """Get description of messaging style"""
-        style_map = {
-            "casual_witty": "Be casual, friendly, and occasionally witty without trying too hard",
-            "formal": "Be polite, respectful, and somewhat formal",
-            "funny": "Be humorous and playful while staying respectful",
-            "flirty": "Be subtly flirty and charming without being inappropriate",
-            "intellectual": "Be thoughtful and show intellectual curiosity"
-        }
-        return style_map.get(self.preferences.get('style', 'casual_witty'), 
-                            "Be friendly and engaging")
+        return STYLE_MAP.get(self.preferences.get('style', 'casual_witty'), "Be friendly and engaging")
                             
     def _get_goal_description(self, stage: ConversationStage) -> str:
         """Get description of conversation goal for current stage"""
-        goal_map = {
-            ConversationStage.BUILD_RAPPORT: "Build rapport and find common ground",
-            ConversationStage.DEEPEN_CONNECTION: "Deepen the connection and show genuine interest",
-            ConversationStage.SUGGEST_MOVE_OFF_APP: "Naturally suggest moving the conversation off the app",
-            ConversationStage.GET_NUMBER: "Smoothly ask for their phone number",
-            ConversationStage.SCHEDULE_DATE: "Suggest a specific date idea based on shared interests"
-        }
-        return goal_map.get(stage, "Keep the conversation engaging")
+        return GOAL_MAP.get(stage, "Keep the conversation engaging")
         
     def _post_process_message(self, message: str, stage: ConversationStage) -> str:
         """Post-process generated message"""
@@ -279,12 +502,7 @@ Generate only the message text, nothing else."""
         
     def _get_fallback_message(self) -> str:
         """Get fallback message if generation fails"""
-        fallbacks = [
-            "Hey! Your profile really caught my attention. How's your day going?",
-            "Hi there! I'd love to know more about you. What's been the highlight of your week?",
-            "Hey! You seem really interesting. What are you up to today?"
-        ]
-        return random.choice(fallbacks)
+        return random.choice(FALLBACK_MESSAGES)
         
     def suggest_date(self, conversation_history: List[Dict], calendar_availability: List[Dict]) -> str:
         """Generate a date suggestion based on conversation and calendar"""
@@ -313,32 +531,40 @@ Generate only the message text, nothing else."""
         
         return message
         
+    def _compile_interest_automaton(self):
+        """Aho-Corasick automaton mapping each lowercased interest keyword to its spellings"""
+        entries: Dict[str, List[str]] = {}
+        for keyword in self.preferences.get('interests', {}).get('preferred', []):
+            if keyword:
+                entries.setdefault(keyword.lower(), []).append(keyword)
+        if not entries:
+            return None
+            
+        automaton = ahocorasick.Automaton()
+        for word, keywords in entries.items():
+            automaton.add_word(word, keywords)
+        automaton.make_automaton()
+        return automaton
+        
     def _extract_shared_interests(self, conversation_history: List[Dict]) -> List[str]:
         """Extract shared interests from conversation"""
-        interests = []
-        interest_keywords = self.preferences.get('interests', {}).get('preferred', [])
-        
-        for msg in conversation_history:
-            for keyword in interest_keywords:
-                if keyword.lower() in msg['text'].lower():
-                    interests.append(keyword)
-                    
-        return list(set(interests))
+        if self._interest_automaton is None or not conversation_history:
+            return []
+            
+        # One lowercased pass over the whole conversation instead of one scan per keyword
+        text = '\n'.join(msg['text'] for msg in conversation_history).lower()
+        interests = set()
+        for _, keywords in self._interest_automaton.iter(text):
+            interests.update(keywords)
+            
+        return list(interests)
         
     def _suggest_activity(self, shared_interests: List[str]) -> str:
         """Suggest date activity based on interests"""
-        activity_map = {
-            "coffee": "coffee at that new place downtown",
-            "fitness": "a hike followed by smoothies",
-            "wine": "wine tasting at that cozy bar",
-            "art": "checking out the new gallery exhibition",
-            "music": "live music at the jazz club",
-            "foodie": "trying that new restaurant everyone's talking about"
-        }
-        
         for interest in shared_interests:
-            if interest.lower() in activity_map:
-                return activity_map[interest.lower()]
+            activity = ACTIVITY_MAP.get(interest.lower())
+            if activity:
+                return activity
                 
         # Default suggestion
         return "coffee or drinks"
@@ -0,0 +1,87 @@
+"""
+Response Cache - Persistent exact-match cache for LLM generations
+Avoids repeat API calls for identical prompts
+"""
+
+import hashlib
+import sqlite3
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, Optional
+from loguru import logger
+
+
+class ResponseCache:
+    """SQLite-backed cache of generated messages keyed on a SHA-256 of the request"""
+    
+    def __init__(self, db_path: str = "cache/llm_responses.db", ttl: timedelta = timedelta(days=7)):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._init_database()
+    
+    def _init_database(self):
+        """Initialize the responses table"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    expires_at REAL NOT NULL
+                )
+            ''')
+    
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Stable key for a request from its model, prompt and sampling settings"""
+        return hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[str]:
+        """Cached response for a key, or None if missing or expired"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                row = conn.execute(
+                    "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[1] < time.time():
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    row = None
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+        
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+    
+    def set(self, key: str, value: str, ttl: Optional[timedelta] = None):
+        """Store a response for a key"""
+        expires_at = time.time() + (ttl or self.ttl).total_seconds()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, value, expires_at)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+    
+    def stats(self) -> Dict:
+        """Hit/miss counts for this process and the number of stored entries"""
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        except sqlite3.Error:
+            entries = None
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': entries
+        }
@@ -0,0 +1,127 @@
+"""
+Semantic Cache - Reuses generated openers for near-duplicate profiles
+Matches profile embeddings by cosine similarity
+"""
+
+import atexit
+import json
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+import numpy as np
+from loguru import logger
+
+
+class SemanticCache:
+    """Embedding-keyed response cache with brute-force cosine search, persisted to disk
+    
+    Adds are written out every save_every entries and at exit rather than one
+    full rewrite per add; safe to use from multiple threads
+    """
+    
+    def __init__(self, path: str = "cache/semantic_openers", dim: int = 1536, threshold: float = 0.92,
+                 ttl: timedelta = timedelta(days=7), max_entries: int = 5000, save_every: int = 25):
+        self.path = Path(path)
+        self.dim = dim
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.save_every = save_every
+        self.vectors = np.empty((0, dim), dtype=np.float32)
+        self.entries: List[Dict] = []
+        self._unsaved = 0
+        self._lock = threading.Lock()
+        # Serializes writes so snapshots reach disk in the order they were taken
+        self._save_lock = threading.Lock()
+        self._load()
+        atexit.register(self.flush)
+    
+    def _load(self):
+        """Load persisted vectors and entries, dropping expired ones"""
+        try:
+            vectors = np.load(self.path / "vectors.npy")
+            with open(self.path / "entries.json", 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if vectors.shape != (len(entries), self.dim):
+            logger.warning("Semantic cache files are inconsistent, starting empty")
+            return
+        self.vectors = vectors.astype(np.float32, copy=False)
+        self.entries = entries
+        self._prune()
+    
+    def _save(self, vectors: np.ndarray, entries: List[Dict]):
+        """Persist a snapshot of vectors and entries"""
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            np.save(self.path / "vectors.npy", vectors)
+            with open(self.path / "entries.json", 'w') as f:
+                json.dump(entries, f)
+        except OSError as e:
+            logger.warning(f"Could not persist semantic cache: {e}")
+    
+    def flush(self):
+        """Write out any entries added since the last save"""
+        with self._save_lock:
+            with self._lock:
+                if not self._unsaved:
+                    return
+                # vectors is replaced, never modified in place, so the snapshot stays valid after unlocking
+                vectors, entries = self.vectors, list(self.entries)
+                self._unsaved = 0
+            self._save(vectors, entries)
+    
+    def _prune(self):
+        """Drop expired entries and the oldest ones beyond max_entries"""
+        cutoff = time.time() - self.ttl.total_seconds()
+        keep = [i for i, entry in enumerate(self.entries) if entry['created_at'] >= cutoff]
+        keep = keep[-self.max_entries:]
+        if len(keep) != len(self.entries):
+            self.vectors = self.vectors[keep]
+            self.entries = [self.entries[i] for i in keep]
+    
+    def _normalize(self, embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32).reshape(self.dim)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    def search(self, embedding) -> Optional[Dict]:
+        """Most similar live entry if its cosine similarity clears the threshold"""
+        query = self._normalize(embedding)
+        with self._lock:
+            if not self.entries:
+                return None
+            self._prune()
+            if not self.entries:
+                return None
+            
+            similarities = self.vectors @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                return None
+            logger.debug(f"Semantic cache hit (similarity {similarities[best]:.3f})")
+            return self.entries[best]
+    
+    def add(self, embedding, response: str, **metadata):
+        """Store a response for an embedding, persisting every save_every adds"""
+        vector = self._normalize(embedding)[None, :]
+        with self._lock:
+            self.vectors = np.vstack([self.vectors, vector])
+            self.entries.append({'response': response, 'created_at': time.time(), **metadata})
+            self._prune()
+            self._unsaved += 1
+            due = self._unsaved >= self.save_every
+        if due:
+            self.flush()
+    
+    def invalidate(self):
+        """Forget every cached response"""
+        with self._lock:
+            self.vectors = np.empty((0, self.dim), dtype=np.float32)
+            self.entries = []
+            self._unsaved = 1
+        self.flush()
@@ -24,7 +24,7 @@ class SourceType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileData:
     """Standardized profile data structure"""
     # Core identification
@@ -61,11 +61,17 @@ class ProfileData:
     # Additional platform-specific data
     extra_data: Dict[str, Any] = field(default_factory=dict)
     
+    @staticmethod
+    def compute_unique_hash(source_type: str, source_id: str, name: Optional[str]) -> str:
+        """12-hex-char dedup hash of a profile's source, source ID and name"""
+        hash_string = f"{source_type}:{source_id}:{name or 'unknown'}"
+        # BLAKE2b sized to the 48 bits we keep, rather than truncating a full MD5
+        return hashlib.blake2b(hash_string.encode(), digest_size=6).hexdigest()
+        
     def get_unique_hash(self) -> str:
         """Generate unique hash for deduplication"""
         # Use source + source_id + name for hashing
-        hash_string = f"{self.source_type.value}:{self.source_id}:{self.name or 'unknown'}"
-        return hashlib.md5(hash_string.encode()).hexdigest()[:12]
+        return self.compute_unique_hash(self.source_type.value, self.source_id, self.name)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for storage"""
@@ -128,7 +134,7 @@ class ProfileData:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ScrapingResult:
     """Result of a scraping operation"""
     profiles: List[ProfileData] = field(default_factory=list)
@@ -80,6 +80,24 @@ class ScraperManager:
             conn.execute('CREATE INDEX IF NOT EXISTS idx_source_type ON profiles(source_type)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_unique_hash ON profiles(unique_hash)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_scraped_at ON profiles(scraped_at)')
+            
+            self._migrate_database(conn)
+    
+    def _migrate_database(self, conn: sqlite3.Connection) -> None:
+        """Bring an existing database up to the current schema version"""
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        
+        if version < 1:
+            # Version 1: unique_hash switched from truncated MD5 to BLAKE2b
+            rows = conn.execute('SELECT id, source_type, source_id, name FROM profiles').fetchall()
+            conn.executemany(
+                'UPDATE OR REPLACE profiles SET unique_hash = ? WHERE id = ?',
+                [(ProfileData.compute_unique_hash(source_type, source_id, name), row_id)
+                 for row_id, source_type, source_id, name in rows]
+            )
+            if rows:
+                logger.info(f"Rehashed {len(rows)} stored profiles")
+            conn.execute('PRAGMA user_version = 1')
     
     def register_scraper(self, scraper: ProfileScraper) -> None:
         """Register a scraper for a specific source type"""
@@ -0,0 +1,37 @@
+"""
+Image Transforms - OpenCV/NumPy preprocessing for the ResNet feature extractors
+Replaces the torchvision PIL pipeline so images decoded by OpenCV go straight to tensors
+"""
+
+import cv2
+import numpy as np
+import torch
+
+
+# ImageNet normalization constants in RGB order, broadcastable over (H, W, 3)
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32).reshape(1, 1, 3)
+IMAGENET_INV_STD = (1.0 / np.array([0.229, 0.224, 0.225], dtype=np.float32)).reshape(1, 1, 3)
+
+
+def fast_transform(img_bgr: np.ndarray, resize: int = 256, crop: int = 224) -> torch.Tensor:
+    """
+    Fused equivalent of Resize(256) + CenterCrop(224) + ToTensor + Normalize
+
+    Takes a BGR uint8 image as decoded by OpenCV and returns a (3, crop, crop)
+    float32 tensor, doing the color flip, scaling and normalization in one pass.
+    """
+    height, width = img_bgr.shape[:2]
+    if height <= width:
+        new_height, new_width = resize, int(resize * width / height)
+    else:
+        new_height, new_width = int(resize * height / width), resize
+
+    interpolation = cv2.INTER_AREA if new_height < height else cv2.INTER_LINEAR
+    resized = cv2.resize(img_bgr, (new_width, new_height), interpolation=interpolation)
+
+    top = int(round((new_height - crop) / 2.0))
+    left = int(round((new_width - crop) / 2.0))
+    rgb = resized[top:top + crop, left:left + crop, ::-1]
+
+    normalized = (rgb.astype(np.float32) * (1.0 / 255.0) - IMAGENET_MEAN) * IMAGENET_INV_STD
+    return torch.from_numpy(np.ascontiguousarray(normalized.transpose(2, 0, 1)))
@@ -76,6 +76,10 @@ class PreferenceManager:
                 "max_swipes_per_hour": 100,
                 "min_delay_seconds": 2,
                 "max_delay_seconds": 5
+            },
+            "performance": {
+                "compile_image_model": False,
+                "image_backbone": "resnet50"
             }
         }
         
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Test script for the vectorized calendar availability check
+"""
+
+import os
+import sys
+import numpy as np
+
+# Add src to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from calendar_manager.calendar_integration import CalendarManager
+
+
+# Four one-hour slots, two per day, as epoch seconds shaped (days, slots)
+SLOT_STARTS = np.array([[0.0, 7200.0], [86400.0, 93600.0]])
+SLOT_ENDS = SLOT_STARTS + 3600.0
+
+
+def test_no_busy_intervals():
+    """Unknown or empty busy lists leave every slot free"""
+    print("🧪 Testing empty and unknown availability...")
+
+    for busy in (None, []):
+        mask = CalendarManager._overlaps_busy(busy, SLOT_STARTS, SLOT_ENDS)
+        assert mask.shape == SLOT_STARTS.shape
+        assert not mask.any()
+
+    print("✅ Empty and unknown availability test passed")
+
+
+def test_touching_edges():
+    """A busy interval that only touches a slot's edge does not block it"""
+    print("\n🧪 Testing busy intervals touching slot edges...")
+
+    # Ends exactly when the first slot starts, and starts exactly when it ends
+    busy = [(-1800.0, 0.0), (3600.0, 7200.0)]
+    mask = CalendarManager._overlaps_busy(busy, SLOT_STARTS, SLOT_ENDS)
+    assert not mask.any()
+
+    # One second of overlap is enough to block
+    busy = [(3599.0, 3601.0)]
+    mask = CalendarManager._overlaps_busy(busy, SLOT_STARTS, SLOT_ENDS)
+    assert mask.tolist() == [[True, False], [False, False]]
+
+    print("✅ Edge-touching intervals test passed")
+
+
+def test_interval_spanning_slots():
+    """A single long busy interval blocks every slot it covers, across days"""
+    print("\n🧪 Testing a busy interval spanning several slots...")
+
+    busy = [(5400.0, 90000.0)]
+    mask = CalendarManager._overlaps_busy(busy, SLOT_STARTS, SLOT_ENDS)
+    assert mask.tolist() == [[False, True], [True, False]]
+
+    # Interval inside a slot, plus an unrelated one later
+    busy = [(900.0, 1800.0), (200000.0, 210000.0)]
+    mask = CalendarManager._overlaps_busy(busy, SLOT_STARTS, SLOT_ENDS)
+    assert mask.tolist() == [[True, False], [False, False]]
+
+    print("✅ Spanning interval test passed")
+
+
+def main():
+    """Run all tests"""
+    print("🚀 Starting Calendar Availability Tests\n")
+
+    try:
+        test_no_busy_intervals()
+        test_touching_edges()
+        test_interval_spanning_slots()
+
+        print("\n🎉 All tests passed! Availability masking is working correctly.")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        raise
+
+
+if __name__ == "__main__":
+    main()
@@ -136,7 +136,16 @@ def test_profile_analyzer_integration():
         assert len(reasons) > 0
         print("✅ Enhanced reasons generation test passed")
         
-        # Test 4: Create mock screenshot for full analysis
+        # Test 4: Red flags only disqualify as whole words
+        analyzer.preferences.setdefault('bio_keywords', {})['negative'] = ['OF', 'poly', '420']
+        prefs = pref_manager.get_all_preferences()
+        assert not analyzer._is_disqualified("lots of hiking", prefs)
+        assert not analyzer._is_disqualified("Grad student at the polytechnic, 4200 ft summit", prefs)
+        assert analyzer._is_disqualified("Link to my OF below", prefs)
+        assert analyzer._is_disqualified("ethically poly, 420 friendly", prefs)
+        print("✅ Red flag whole-word matching test passed")
+        
+        # Test 5: Create mock screenshot for full analysis
         with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp:
             # Create a simple test image
             test_img = create_test_image(800, 600, (200, 150, 100))